@@ -39,6 +39,7 @@ Features:
     - Comprehensive type hints for IDE autocomplete
     - Request/response metadata tracking
     - Rate limiting (2,000 calls/hour)
+    - asyncio client for concurrent calls (``hfortix_fortiztp.aio.AsyncFortiZTP``)
 
 API Coverage:
     Devices (10 endpoints):
@@ -67,11 +68,24 @@ from typing import TYPE_CHECKING, Any, Optional
 from hfortix_core.http.cloud_client import CloudHTTPClient
 from hfortix_core.http.oauth import FortiCloudAuth
 from hfortix_core.session import CloudSession
-from hfortix_core.ratelimit import RateLimitStats
 
 # Response models
 from .models import FortiZTPResponse
 
+# Optional GET response cache
+from .cache import CachingHTTPClient, ResponseCache
+
+# Token helpers shared with the async client
+from ._auth import _LoginRefresher, _TokenRefresher
+
+# HTTP clients shared between instances on the same CloudSession
+from .pool import (
+    SharedPoolHTTPClient,
+    _get_ssl_context,
+    acquire_session_client,
+    release_session_client,
+)
+
 # Type definitions
 from .types import (
     DeviceType,
@@ -100,6 +114,23 @@ if TYPE_CHECKING:
 __version__ = "0.5.161"
 
 
+# Library defaults for the rate limiting / circuit breaker settings that a
+# CloudSession can override (looked up on the session as "_<name>").
+_SESSION_DEFAULTS: dict[str, Any] = {
+    "rate_limit": False,
+    "rate_limit_strategy": "queue",
+    "rate_limit_max_requests": 100,
+    "rate_limit_window_seconds": 60.0,
+    "rate_limit_queue_size": 100,
+    "rate_limit_queue_timeout": 30.0,
+    "rate_limit_queue_overflow": "block",
+    "circuit_breaker": False,
+    "circuit_breaker_threshold": 5,
+    "circuit_breaker_timeout": 60.0,
+    "circuit_breaker_half_open_calls": 3,
+}
+
+
 class FortiZTP:
     """
     FortiZTP Cloud API client.
@@ -108,12 +139,24 @@ class FortiZTP:
     Handles OAuth 2.0 authentication and provides access to all API endpoints.
     
     Authentication:
-        Automatically obtains OAuth token using API credentials, accepts
-        pre-obtained token, or uses shared CloudSession.
+        Automatically obtains OAuth token using API credentials (logging in
+        again shortly before it expires), accepts pre-obtained token, or
+        uses shared CloudSession.
     
     Rate Limits:
         - 2,000 calls per hour
     
+    Transport:
+        Requests go over a pooled HTTP/2 connection (httpx with h2), so
+        keep-alive and TLS sessions are reused across calls and concurrent
+        requests are multiplexed as streams on one connection. All clients
+        share one SSL context, so the CA bundle is only loaded once. Clients
+        created from the same CloudSession with the same settings share
+        one HTTP client, so get_retry_stats() and get_connection_stats()
+        report their combined activity. Clients created with cache=True or
+        track_operations=True keep per-instance state and always get their
+        own HTTP client.
+    
     Args:
         api_id: FortiCloud API ID (for auto-login)
         password: FortiCloud password (for auto-login)
@@ -122,10 +165,26 @@ class FortiZTP:
         session: CloudSession for multi-service token management (recommended)
         base_url: API base URL (default: https://fortiztp.forticloud.com/public/api)
         auth_url: OAuth token endpoint (optional - uses FortiCloud default)
+        token_cache: Reuse a token obtained for the same credentials in the
+            last 30 minutes instead of logging in again (default: True)
         verify: Enable SSL certificate verification (default: True)
         max_retries: Maximum number of retry attempts (default: 3)
         connect_timeout: Connection timeout in seconds (default: 10.0)
         read_timeout: Read timeout in seconds (default: 300.0)
+        max_connections: Maximum pooled connections to the API host (default: 100)
+        max_keepalive_connections: Idle keep-alive connections kept warm for
+            reuse, avoiding a TLS handshake per request (default: 20)
+        cache: Serve repeated GET requests from an in-memory cache; any write
+            clears it, and calls made with use_cache=False bypass it
+            (default: False)
+        cache_ttl: Seconds a cached GET response stays fresh (default: 60.0)
+        shared_pool: Send requests over one process-wide connection pool
+            shared by all clients created with shared_pool=True, e.g. one
+            FortiZTP per worker thread. The pool holds 50 connections; to
+            size it for your worker count, call
+            ``hfortix_fortiztp.pool.get_shared_pool(maxsize=N)`` before
+            creating the first such client. The shared pool always verifies
+            certificates, so this is ignored with verify=False (default: False)
         read_only: Enable read-only mode - simulate write operations (default: False)
         track_operations: Enable operation tracking for audit logging (default: False)
         audit_handler: Handler for audit logging (implements AuditHandler protocol)
@@ -177,7 +236,25 @@ class FortiZTP:
     scripts: "ScriptsAPI"
     fortimanagers: "FortiManagersAPI"
     system: "SystemAPI"
-
+    
+    # Endpoint groups proxied from self.api by __getattr__
+    _API_ATTRS = frozenset({"devices", "scripts", "fortimanagers", "system"})
+    
+    __slots__ = (
+        "_auth",
+        "_client",
+        "_session",
+        "_client_id",
+        "_cache",
+        "_shared_client",
+        "_released",
+        "_base_url",
+        "api",
+        "devices",
+        "scripts",
+        "fortimanagers",
+        "system",
+    )
     
     def __init__(
         self,
@@ -188,10 +265,16 @@ class FortiZTP:
         session: Optional[CloudSession] = None,
         base_url: str = "https://fortiztp.forticloud.com/public/api",
         auth_url: Optional[str] = None,
+        token_cache: bool = True,
         verify: bool = True,
         max_retries: int = 3,
         connect_timeout: float = 10.0,
         read_timeout: float = 300.0,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        cache: bool = False,
+        cache_ttl: float = 60.0,
+        shared_pool: bool = False,
         read_only: bool = False,
         track_operations: bool = False,
         audit_handler: Optional[Any] = None,
@@ -205,48 +288,49 @@ class FortiZTP:
         rate_limit_errors_per_5min: Optional[int] = None,
         rate_limit_errors_per_hour: Optional[int] = None,
         # NEW: Rate limiting enforcement parameters
-        rate_limit: bool = False,
-        rate_limit_strategy: str = "queue",
-        rate_limit_max_requests: int = 100,
-        rate_limit_window_seconds: float = 60.0,
-        rate_limit_queue_size: int = 100,
-        rate_limit_queue_timeout: float = 30.0,
-        rate_limit_queue_overflow: str = "block",
-        circuit_breaker: bool = False,
-        circuit_breaker_threshold: int = 5,
-        circuit_breaker_timeout: float = 60.0,
-        circuit_breaker_half_open_calls: int = 3,
+        # (None = inherit from session, or use _SESSION_DEFAULTS without one)
+        rate_limit: Optional[bool] = None,
+        rate_limit_strategy: Optional[str] = None,
+        rate_limit_max_requests: Optional[int] = None,
+        rate_limit_window_seconds: Optional[float] = None,
+        rate_limit_queue_size: Optional[int] = None,
+        rate_limit_queue_timeout: Optional[float] = None,
+        rate_limit_queue_overflow: Optional[str] = None,
+        circuit_breaker: Optional[bool] = None,
+        circuit_breaker_threshold: Optional[int] = None,
+        circuit_breaker_timeout: Optional[float] = None,
+        circuit_breaker_half_open_calls: Optional[int] = None,
     ) -> None:
         """Initialize FortiZTP client with OAuth credentials."""
         # Determine client_id (use provided, or session-specific, or default)
         self._client_id = client_id if client_id is not None else self.DEFAULT_CLIENT_ID
         self._session = session
+        self._base_url = base_url
         
-        # If using session and rate limiting params not provided, use session defaults
-        if session:
-            # Use session's rate limiting settings as defaults (can be overridden by explicit params)
-            if rate_limit is False and session._rate_limit:
-                rate_limit = session._rate_limit
-            if rate_limit_strategy == "queue" and session._rate_limit_strategy != "queue":
-                rate_limit_strategy = session._rate_limit_strategy
-            if rate_limit_max_requests == 100 and session._rate_limit_max_requests != 100:
-                rate_limit_max_requests = session._rate_limit_max_requests
-            if rate_limit_window_seconds == 60.0 and session._rate_limit_window_seconds != 60.0:
-                rate_limit_window_seconds = session._rate_limit_window_seconds
-            if rate_limit_queue_size == 100 and session._rate_limit_queue_size != 100:
-                rate_limit_queue_size = session._rate_limit_queue_size
-            if rate_limit_queue_timeout == 30.0 and session._rate_limit_queue_timeout != 30.0:
-                rate_limit_queue_timeout = session._rate_limit_queue_timeout
-            if rate_limit_queue_overflow == "block" and session._rate_limit_queue_overflow != "block":
-                rate_limit_queue_overflow = session._rate_limit_queue_overflow
-            if circuit_breaker is False and session._circuit_breaker:
-                circuit_breaker = session._circuit_breaker
-            if circuit_breaker_threshold == 5 and session._circuit_breaker_threshold != 5:
-                circuit_breaker_threshold = session._circuit_breaker_threshold
-            if circuit_breaker_timeout == 60.0 and session._circuit_breaker_timeout != 60.0:
-                circuit_breaker_timeout = session._circuit_breaker_timeout
-            if circuit_breaker_half_open_calls == 3 and session._circuit_breaker_half_open_calls != 3:
-                circuit_breaker_half_open_calls = session._circuit_breaker_half_open_calls
+        # Explicit arguments win; unset (None) ones fall back to the session's
+        # settings when a session is given, otherwise to the library defaults
+        overrides = {
+            "rate_limit": rate_limit,
+            "rate_limit_strategy": rate_limit_strategy,
+            "rate_limit_max_requests": rate_limit_max_requests,
+            "rate_limit_window_seconds": rate_limit_window_seconds,
+            "rate_limit_queue_size": rate_limit_queue_size,
+            "rate_limit_queue_timeout": rate_limit_queue_timeout,
+            "rate_limit_queue_overflow": rate_limit_queue_overflow,
+            "circuit_breaker": circuit_breaker,
+            "circuit_breaker_threshold": circuit_breaker_threshold,
+            "circuit_breaker_timeout": circuit_breaker_timeout,
+            "circuit_breaker_half_open_calls": circuit_breaker_half_open_calls,
+        }
+        defaults = (
+            {name: getattr(session, f"_{name}") for name in _SESSION_DEFAULTS}
+            if session
+            else _SESSION_DEFAULTS
+        )
+        enforcement = {
+            name: value if value is not None else defaults[name]
+            for name, value in overrides.items()
+        }
         
         # Obtain OAuth token based on auth method
         self._auth: Optional[FortiCloudAuth] = None
@@ -258,10 +342,7 @@ class FortiZTP:
             # Create token callback for auto-refresh before each request
             # Only if check_before_request is enabled (default: True)
             if session._check_before_request:
-                def get_fresh_token() -> str:
-                    return session.ensure_token_valid(self._client_id)
-                
-                token_callback = get_fresh_token
+                token_callback = _TokenRefresher(session, self._client_id)
             else:
                 token_callback = None
         elif not oauth_token:
@@ -278,75 +359,108 @@ class FortiZTP:
                 client_id=self._client_id,
                 auth_url=auth_url,
             )
-            oauth_token = self._auth.get_token()
-            token_callback = None
+            # Logs in again shortly before each token expires
+            token_callback = _LoginRefresher(self._auth, use_cache=token_cache)
+            oauth_token = token_callback()
         else:
             # Pre-obtained token mode
             token_callback = None
         
         # Initialize HTTP client with OAuth authentication
-        self._client = CloudHTTPClient(
-            url=base_url,
-            oauth_token=oauth_token,
-            verify=verify,
-            max_retries=max_retries,
-            connect_timeout=connect_timeout,
-            read_timeout=read_timeout,
-            read_only=read_only,
-            track_operations=track_operations,
-            audit_handler=audit_handler,
-            audit_callback=audit_callback,
-            user_context=user_context,
-            token_callback=token_callback,
+        client_settings: dict[str, Any] = {
+            "verify": _get_ssl_context() if verify else False,
+            "max_retries": max_retries,
+            "connect_timeout": connect_timeout,
+            "read_timeout": read_timeout,
+            "max_connections": max_connections,
+            "max_keepalive_connections": max_keepalive_connections,
+            "read_only": read_only,
+            "track_operations": track_operations,
+            "audit_handler": audit_handler,
+            "audit_callback": audit_callback,
+            "user_context": user_context,
+            # Rate limit tracking - FortiZTP documented limit is 2000 calls/hour
+            "rate_limit_calls_per_min": rate_limit_calls_per_min,
+            "rate_limit_calls_per_5min": rate_limit_calls_per_5min,
+            "rate_limit_calls_per_hour": rate_limit_calls_per_hour,
+            "rate_limit_errors_per_min": rate_limit_errors_per_min,
+            "rate_limit_errors_per_5min": rate_limit_errors_per_5min,
+            "rate_limit_errors_per_hour": rate_limit_errors_per_hour,
             # NEW: Pass rate limiting parameters
-            rate_limit=rate_limit,
-            rate_limit_strategy=rate_limit_strategy,
-            rate_limit_max_requests=rate_limit_max_requests,
-            rate_limit_window_seconds=rate_limit_window_seconds,
-            rate_limit_queue_size=rate_limit_queue_size,
-            rate_limit_queue_timeout=rate_limit_queue_timeout,
-            rate_limit_queue_overflow=rate_limit_queue_overflow,
-            circuit_breaker=circuit_breaker,
-            circuit_breaker_threshold=circuit_breaker_threshold,
-            circuit_breaker_timeout=circuit_breaker_timeout,
-            circuit_breaker_half_open_calls=circuit_breaker_half_open_calls,
-        )
+            **enforcement,
+        }
         
-        # Rate limit tracking for this client instance
-        # Set limits as needed: FortiZTP documented limit is 2000 calls/hour
-        self._rate_stats = RateLimitStats(
-            calls_per_min=rate_limit_calls_per_min,
-            calls_per_5min=rate_limit_calls_per_5min,
-            calls_per_hour=rate_limit_calls_per_hour,
-            errors_per_min=rate_limit_errors_per_min,
-            errors_per_5min=rate_limit_errors_per_5min,
-            errors_per_hour=rate_limit_errors_per_hour,
-        )
+        client_class = SharedPoolHTTPClient if shared_pool and verify else CloudHTTPClient
+        
+        def create_client() -> CloudHTTPClient:
+            return client_class(
+                url=base_url,
+                oauth_token=oauth_token,
+                token_callback=token_callback,
+                **client_settings,
+            )
+        
+        if session and not (cache or track_operations):
+            # Reuse the connection pool of other FortiZTP clients on this
+            # session (same base_url, client_id and settings). A response
+            # cache or operations log is per instance, so those clients get
+            # an HTTP client of their own instead of one that also carries
+            # other instances' writes and calls
+            self._client, self._shared_client = acquire_session_client(
+                session,
+                base_url,
+                self._client_id,
+                {**client_settings, "shared_pool": shared_pool},
+                create_client,
+            )
+        else:
+            self._client = create_client()
+            self._shared_client = False
+        
+        self._released = False
+        
+        # Optional GET response cache in front of the HTTP client
+        self._cache: Optional[ResponseCache] = ResponseCache(ttl=cache_ttl) if cache else None
         
         # Initialize API endpoints
         from .api.v2 import V2API
-        self.api = V2API(self._client)
+        self.api = V2API(
+            CachingHTTPClient(self._client, self._cache) if self._cache is not None else self._client
+        )
         
-        # Also expose devices, scripts, etc. directly for cleaner API
-        # (client.devices.get() instead of client.api.devices.get())
-        self.devices = self.api.devices
-        self.scripts = self.api.scripts
-        self.fortimanagers = self.api.fortimanagers
-        self.system = self.api.system
+        # devices, scripts, etc. are also exposed directly for cleaner API
+        # (client.devices.get() instead of client.api.devices.get()) - see
+        # __getattr__, which creates them on first access
 
     
+    def __getattr__(self, name: str) -> Any:
+        """
+        Proxy devices/scripts/fortimanagers/system to the V2 API.
+        
+        Only called for attributes not found normally; the endpoint group is
+        created on first access and cached on the instance.
+        """
+        if name in self._API_ATTRS:
+            value = getattr(self.api, name)
+            setattr(self, name, value)
+            return value
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+    
     def get_rate_limit_status(self) -> dict[str, Any]:
         """
         Get rate limit status for this FortiZTP client.
         
-        Returns statistics about API calls and errors for this specific
-        client instance (not session-wide).
+        Returns statistics about API calls and errors recorded by this
+        client's HTTP client (not session-wide; clients sharing one HTTP
+        client on a CloudSession report their combined calls).
         
         Returns:
             Dictionary containing:
-            - calls_last_minute: Call count in last 60 seconds
+            - calls_last_min: Call count in last 60 seconds
+            - calls_last_5min: Call count in last 300 seconds
             - calls_last_hour: Call count in last 3600 seconds
-            - errors_last_minute: Error count in last 60 seconds
+            - errors_last_min: Error count in last 60 seconds
+            - errors_last_5min: Error count in last 300 seconds
             - errors_last_hour: Error count in last 3600 seconds
             - total_calls: Total calls since client creation
             - total_errors: Total errors since client creation
@@ -358,7 +472,7 @@ class FortiZTP:
             >>> status = fz.get_rate_limit_status()
             >>> print(f"Calls last hour: {status['calls_last_hour']}/{status['limits']['calls_per_hour']}")
         """
-        return self._rate_stats.get_status()
+        return self._client.get_rate_limit_status()
     
     def get_retry_stats(self) -> dict[str, Any]:
         """
@@ -385,6 +499,51 @@ class FortiZTP:
         """
         return self._client.get_retry_stats()
     
+    def get_connection_stats(self) -> dict[str, Any]:
+        """
+        Get connection pool statistics from HTTP client.
+        
+        Use this to verify that keep-alive connections are being reused
+        rather than re-established for every request.
+        
+        Returns:
+            Dictionary containing:
+            - http2_enabled: Whether HTTP/2 is enabled
+            - max_connections: Maximum allowed connections
+            - max_keepalive_connections: Maximum keep-alive connections
+            - active_requests: Number of currently active requests
+            - total_requests: Total number of requests made
+            - client_active: Whether the HTTP session is initialized
+        
+        Example:
+            >>> client = FortiZTP(oauth_token="...", max_keepalive_connections=10)
+            >>> stats = client.get_connection_stats()
+            >>> print(f"Active: {stats['active_requests']}/{stats['max_connections']}")
+        """
+        return self._client.get_connection_stats()
+    
+    def get_cache_stats(self) -> Optional[dict[str, Any]]:
+        """
+        Get GET response cache statistics.
+        
+        Returns:
+            Dictionary with size, maxsize, ttl, hits and misses, or None if
+            the client was created without cache=True
+        
+        Example:
+            >>> client = FortiZTP(oauth_token="...", cache=True)
+            >>> client.system.get()
+            >>> client.system.get()  # served from cache
+            >>> print(client.get_cache_stats()["hits"])
+            1
+        """
+        return self._cache.get_stats() if self._cache is not None else None
+    
+    def clear_cache(self) -> None:
+        """Drop all cached GET responses (no-op if caching is disabled)."""
+        if self._cache is not None:
+            self._cache.clear()
+    
     def get_operations(self) -> list[dict[str, Any]]:
         """
         Get audit log of all tracked API operations.
@@ -428,14 +587,21 @@ class FortiZTP:
         
         Note:
             OAuth token revocation should be handled separately.
-            This method only closes the HTTP connection.
+            This method only closes the HTTP connection. If the connection
+            is shared with other clients on the same CloudSession, it is
+            closed when the last of them logs out.
         
         Example:
             >>> client = FortiZTP(api_id="...", password="...")
             >>> # ... use client ...
             >>> client.logout()
         """
-        self._client.logout()
+        if not self._shared_client:
+            self._client.logout()
+        elif not self._released:
+            # Drop this instance's reference; the last one closes the client
+            self._released = True
+            release_session_client(self._session, self._base_url, self._client_id)
     
     def __enter__(self) -> "FortiZTP":
         """Context manager entry."""
@@ -447,7 +613,7 @@ class FortiZTP:
     
     def __repr__(self) -> str:
         """String representation of FortiZTP client."""
-        return f"FortiZTP(base_url='{self._client._url}')"
+        return f"FortiZTP(base_url='{self._base_url}')"
 
 
 __all__ = [
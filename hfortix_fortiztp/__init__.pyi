@@ -4,6 +4,12 @@ from typing import Any, Optional
 
 from hfortix_core.http import CloudHTTPClient
 from hfortix_core.http.oauth import FortiCloudAuth
+from hfortix_core.session import CloudSession
+from .api.v2 import V2API
+from .api.v2.devices import DevicesAPI
+from .api.v2.fortimanagers import FortiManagersAPI
+from .api.v2.scripts import ScriptsAPI
+from .api.v2.system import SystemAPI
 from .models import FortiZTPResponse
 from .types import (
     DeviceType,
@@ -24,29 +30,66 @@ from .types import (
 __version__: str
 
 class FortiZTP:
+    DEFAULT_CLIENT_ID: str
+    
     _auth: Optional[FortiCloudAuth]
     _client: CloudHTTPClient
     
+    api: V2API
+    devices: DevicesAPI
+    scripts: ScriptsAPI
+    fortimanagers: FortiManagersAPI
+    system: SystemAPI
+    
     def __init__(
         self,
         api_id: Optional[str] = None,
         password: Optional[str] = None,
-        client_id: str = "fortiztp",
+        client_id: Optional[str] = None,
         oauth_token: Optional[str] = None,
+        session: Optional[CloudSession] = None,
         base_url: str = "https://fortiztp.forticloud.com/public/api",
         auth_url: Optional[str] = None,
+        token_cache: bool = True,
         verify: bool = True,
         max_retries: int = 3,
         connect_timeout: float = 10.0,
         read_timeout: float = 300.0,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        cache: bool = False,
+        cache_ttl: float = 60.0,
+        shared_pool: bool = False,
         read_only: bool = False,
         track_operations: bool = False,
         audit_handler: Optional[Any] = None,
         audit_callback: Optional[Any] = None,
         user_context: Optional[dict[str, Any]] = None,
+        rate_limit_calls_per_min: Optional[int] = None,
+        rate_limit_calls_per_5min: Optional[int] = None,
+        rate_limit_calls_per_hour: Optional[int] = None,
+        rate_limit_errors_per_min: Optional[int] = None,
+        rate_limit_errors_per_5min: Optional[int] = None,
+        rate_limit_errors_per_hour: Optional[int] = None,
+        rate_limit: Optional[bool] = None,
+        rate_limit_strategy: Optional[str] = None,
+        rate_limit_max_requests: Optional[int] = None,
+        rate_limit_window_seconds: Optional[float] = None,
+        rate_limit_queue_size: Optional[int] = None,
+        rate_limit_queue_timeout: Optional[float] = None,
+        rate_limit_queue_overflow: Optional[str] = None,
+        circuit_breaker: Optional[bool] = None,
+        circuit_breaker_threshold: Optional[int] = None,
+        circuit_breaker_timeout: Optional[float] = None,
+        circuit_breaker_half_open_calls: Optional[int] = None,
     ) -> None: ...
     
+    def get_rate_limit_status(self) -> dict[str, Any]: ...
     def get_retry_stats(self) -> dict[str, Any]: ...
+    def get_connection_stats(self) -> dict[str, Any]: ...
+    def get_cache_stats(self) -> Optional[dict[str, Any]]: ...
+    def clear_cache(self) -> None: ...
+    def get_operations(self) -> list[dict[str, Any]]: ...
     def logout(self) -> None: ...
     def __enter__(self) -> FortiZTP: ...
     def __exit__(self, *args: object) -> None: ...
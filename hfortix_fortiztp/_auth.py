@@ -0,0 +1,179 @@
+"""
+OAuth token helpers shared by the sync and async FortiZTP clients.
+
+- A process-wide cache of direct-auth (api_id/password) tokens
+- _LoginRefresher, the token callback for direct-auth clients
+- _TokenRefresher, the token callback for CloudSession-backed clients
+"""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Optional, Tuple
+
+from hfortix_core.http.oauth import FortiCloudAuth
+from hfortix_core.session import CloudSession
+
+
+# Process-wide OAuth token cache for direct (api_id/password) auth, so that
+# re-creating a client does not pay a fresh OAuth round-trip every time.
+# Key: (api_id, password digest, client_id, auth_url) -> (token, expires_at)
+# where expires_at is a time.monotonic() deadline.
+_TOKEN_CACHE: "OrderedDict[tuple[str, str, str, str], tuple[str, float]]" = OrderedDict()
+_TOKEN_CACHE_LOCK = threading.Lock()
+_TOKEN_CACHE_MAXSIZE = 32
+# FortiCloud OAuth tokens are valid for one hour. A cached one is only handed
+# to a new client while it still has at least half its lifetime left, so the
+# client doesn't have to log in again almost straight away.
+_TOKEN_TTL = 3600.0
+_TOKEN_MAX_REUSE_AGE = _TOKEN_TTL / 2
+# Direct-auth clients log in again this many seconds before their token
+# expires (same default as CloudSession's refresh buffer)
+_TOKEN_REFRESH_BUFFER = 300.0
+
+
+def _get_token(auth: FortiCloudAuth, use_cache: bool = True) -> Tuple[str, float]:
+    """
+    Get an OAuth token for auth, reusing a recently obtained cached token.
+    
+    A cached token is reused for at most half the token lifetime after it
+    was obtained, so every client gets a token with at least 30 minutes
+    left. Otherwise auth logs in again (its own cached token is not used).
+    
+    Args:
+        auth: Configured FortiCloudAuth helper
+        use_cache: Look up and store the token in the process-wide cache
+    
+    Returns:
+        Tuple of (access token, time.monotonic() deadline it expires at)
+    """
+    if not use_cache:
+        return auth.get_token(force_refresh=True), time.monotonic() + _TOKEN_TTL
+    
+    key = (
+        auth.api_id,
+        hashlib.sha256(auth.password.encode()).hexdigest(),
+        auth.client_id,
+        auth.auth_url,
+    )
+    with _TOKEN_CACHE_LOCK:
+        entry = _TOKEN_CACHE.get(key)
+        if entry is not None and time.monotonic() < entry[1] - _TOKEN_MAX_REUSE_AGE:
+            _TOKEN_CACHE.move_to_end(key)
+            return entry
+    
+    token = auth.get_token(force_refresh=True)
+    expires_at = time.monotonic() + _TOKEN_TTL
+    with _TOKEN_CACHE_LOCK:
+        _TOKEN_CACHE[key] = (token, expires_at)
+        _TOKEN_CACHE.move_to_end(key)
+        while len(_TOKEN_CACHE) > _TOKEN_CACHE_MAXSIZE:
+            _TOKEN_CACHE.popitem(last=False)
+    return token, expires_at
+
+
+class _LoginRefresher:
+    """
+    Token callback for direct-auth (api_id/password) clients.
+    
+    FortiCloud password-grant tokens can't be refreshed, so shortly before
+    the current token expires this logs in again (through _get_token, so
+    clients with the same credentials share the new token). Until then the
+    current token is returned after a single clock comparison.
+    
+    Args:
+        auth: Configured FortiCloudAuth helper
+        use_cache: Share tokens through the process-wide cache
+    """
+    
+    __slots__ = ("_auth", "_use_cache", "_token", "_refresh_at", "_lock")
+    
+    def __init__(self, auth: FortiCloudAuth, use_cache: bool = True) -> None:
+        self._auth = auth
+        self._use_cache = use_cache
+        self._token = ""
+        # time.monotonic() deadline; 0.0 logs in on the next call
+        self._refresh_at = 0.0
+        self._lock = threading.Lock()
+    
+    def current(self) -> Optional[str]:
+        """Return the current token if it is not due for renewal yet, else None."""
+        if time.monotonic() < self._refresh_at:
+            return self._token
+        return None
+    
+    def __call__(self) -> str:
+        token = self.current()
+        if token is not None:
+            return token
+        
+        with self._lock:
+            # Another thread may have logged in while we waited
+            token = self.current()
+            if token is not None:
+                return token
+            token, expires_at = _get_token(self._auth, use_cache=self._use_cache)
+            self._token = token
+            self._refresh_at = expires_at - _TOKEN_REFRESH_BUFFER
+            return token
+
+
+class _TokenRefresher:
+    """
+    Token callback for CloudSession-backed clients.
+    
+    The HTTP client calls this before every request. While the last token
+    is outside the session's refresh buffer, and the session still holds
+    the same token entry it came from, it is returned after a clock
+    comparison and one dict lookup; otherwise - near expiry, or after
+    clear_token(), a revoke or a refresh through another client replaced
+    the entry - it goes through session.ensure_token_valid(), which takes
+    the session lock and may refresh the token.
+    
+    CloudSession has no public view of a token's expiry or identity, so
+    this reads its _tokens and _refresh_buffer attributes.
+    
+    Args:
+        session: CloudSession that owns the token
+        client_id: OAuth client_id of the token
+    """
+    
+    __slots__ = ("_session", "_client_id", "_token", "_info", "_refresh_at")
+    
+    def __init__(self, session: CloudSession, client_id: str) -> None:
+        self._session = session
+        self._client_id = client_id
+        self._token = ""
+        # Session token entry (TokenInfo) self._token was read from
+        self._info: Any = None
+        # time.monotonic() deadline; 0.0 sends the next call to the session
+        self._refresh_at = 0.0
+    
+    def current(self) -> Optional[str]:
+        """Return the last token if it can be reused without asking the session, else None."""
+        if (
+            time.monotonic() < self._refresh_at
+            and self._session._tokens.get(self._client_id) is self._info
+        ):
+            return self._token
+        return None
+    
+    def __call__(self) -> str:
+        token = self.current()
+        if token is not None:
+            return token
+        
+        token = self._session.ensure_token_valid(self._client_id)
+        info = self._session._tokens.get(self._client_id)
+        if info is not None and info.access_token == token:
+            self._info = info
+            self._refresh_at = (
+                time.monotonic() + info.time_remaining - self._session._refresh_buffer
+            )
+        else:
+            # Expiry unknown - ask the session again on the next request
+            self._info = None
+            self._refresh_at = 0.0
+        self._token = token
+        return token
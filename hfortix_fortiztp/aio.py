@@ -0,0 +1,601 @@
+"""
+FortiZTP Cloud API SDK - asyncio client.
+
+Provides :class:`AsyncFortiZTP`, an ``asyncio`` peer of
+:class:`hfortix_fortiztp.FortiZTP` built on ``httpx.AsyncClient``.
+Every endpoint method is a coroutine, so independent calls can be
+overlapped on the event loop instead of paying one round-trip each.
+
+Basic Usage:
+    >>> import asyncio
+    >>> from hfortix_fortiztp.aio import AsyncFortiZTP
+    >>>
+    >>> async def main(serials):
+    ...     async with AsyncFortiZTP(api_id="...", password="...") as fz:
+    ...         # Fetch many devices concurrently
+    ...         return await asyncio.gather(
+    ...             *[fz.devices.get(device_sn=sn) for sn in serials]
+    ...         )
+    >>>
+    >>> responses = asyncio.run(main(["FGT60FTK19000001", "FGT60FTK19000002"]))
+
+Note:
+    Throughput is still bounded by the FortiZTP rate limit
+    (2,000 calls/hour) - concurrency removes the latency, not the quota.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import ssl
+import time
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Optional, TypeVar, Union
+from urllib.parse import urlencode
+
+import httpx
+from hfortix_core.http.oauth import FortiCloudAuth
+from hfortix_core.session import CloudSession
+
+from ._auth import _LoginRefresher, _TokenRefresher
+from ._json import dumps as _dumps
+from ._json import loads as _loads
+from .pool import _get_ssl_context
+
+if TYPE_CHECKING:
+    from .api.v2 import AsyncV2API
+    from .api.v2.devices import AsyncDevicesAPI
+    from .api.v2.scripts import AsyncScriptsAPI
+    from .api.v2.fortimanagers import AsyncFortiManagersAPI
+    from .api.v2.system import AsyncSystemAPI
+
+
+logger = logging.getLogger("hfortix.fortiztp.aio")
+
+T = TypeVar("T")
+
+# HTTP status codes worth retrying (rate limit and transient server errors)
+_RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+
+class AsyncCloudHTTPClient:
+    """
+    Async HTTP client for the FortiZTP Cloud API.
+
+    Mirrors the request/response contract of
+    ``hfortix_core.http.cloud_client.CloudHTTPClient`` - methods return the
+    same response envelope dict (``data``, ``http_status_code``,
+    ``response_time``, ``request_info``) - but every request is a coroutine
+    on a shared ``httpx.AsyncClient`` with HTTP/2 enabled.
+
+    Args:
+        url: Base URL of the API
+        oauth_token: OAuth 2.0 Bearer token
+        verify: Enable SSL certificate verification, or an SSLContext to use
+            (default: True - the shared process-wide context)
+        max_retries: Maximum number of retry attempts (default: 3)
+        connect_timeout: Connection timeout in seconds (default: 10.0)
+        read_timeout: Read timeout in seconds (default: 300.0)
+        max_connections: Maximum number of connections (default: 100)
+        max_keepalive_connections: Max keepalive connections (default: 20)
+        http2: Negotiate HTTP/2 so concurrent requests are multiplexed as
+            streams over one connection (default: True)
+        read_only: Simulate write operations without executing (default: False)
+        token_callback: Optional callback returning a fresh token before each
+            request; runs in a worker thread, so it may block
+        user_agent: Custom User-Agent header (optional)
+
+    Raises:
+        ValueError: If oauth_token is empty
+    """
+
+    def __init__(
+        self,
+        url: str,
+        oauth_token: str,
+        verify: Union[bool, ssl.SSLContext] = True,
+        max_retries: int = 3,
+        connect_timeout: float = 10.0,
+        read_timeout: float = 300.0,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        http2: bool = True,
+        read_only: bool = False,
+        token_callback: Optional[Callable[[], str]] = None,
+        user_agent: Optional[str] = None,
+    ) -> None:
+        """Initialize async cloud HTTP client."""
+        if not oauth_token:
+            raise ValueError("oauth_token is required for cloud authentication")
+
+        self._url = url.rstrip("/")
+        self._oauth_token = oauth_token
+        self._verify = verify
+        self._max_retries = max_retries
+        self._connect_timeout = connect_timeout
+        self._read_timeout = read_timeout
+        self._max_connections = max_connections
+        self._max_keepalive_connections = max_keepalive_connections
+        self._http2 = http2
+        self._read_only = read_only
+        self._token_callback = token_callback
+        # Serializes slow-path token refreshes; created on first use so it
+        # binds to the loop the client runs on
+        self._token_lock: Optional[asyncio.Lock] = None
+        if user_agent is None:
+            from hfortix_fortiztp import __version__
+            user_agent = f"hfortix-fortiztp/{__version__}"
+        self._user_agent = user_agent
+        self._session: Optional[httpx.AsyncClient] = None
+
+        # Request counters
+        self._active_requests = 0
+        self._total_requests = 0
+        # Protocol actually negotiated with the server (e.g. "HTTP/2")
+        self._http_version: Optional[str] = None
+
+    async def _refresh_token_if_needed(self) -> None:
+        """
+        Call token_callback (if configured) and update the Bearer header.
+
+        The callback may block (a CloudSession takes its lock and may
+        request a new token), so it runs in a worker thread instead of on
+        the event loop, one call at a time: concurrent requests wait for
+        the refresh in progress rather than each starting their own.
+        Callbacks with a ``current()`` fast path - the built-in refreshers -
+        are only offloaded when that returns None.
+        """
+        if self._token_callback:
+            current = getattr(self._token_callback, "current", None)
+            fresh_token: Optional[str] = current() if current is not None else None
+            if fresh_token is None:
+                if self._token_lock is None:
+                    self._token_lock = asyncio.Lock()
+                async with self._token_lock:
+                    # A request that held the lock before us may have refreshed it
+                    fresh_token = current() if current is not None else None
+                    if fresh_token is None:
+                        fresh_token = await asyncio.to_thread(self._token_callback)
+            if fresh_token != self._oauth_token:
+                self._oauth_token = fresh_token
+                if self._session is not None:
+                    self._session.headers["Authorization"] = f"Bearer {fresh_token}"
+
+    def _get_session(self) -> httpx.AsyncClient:
+        """
+        Get or create the shared ``httpx.AsyncClient``.
+
+        Sessions are created lazily and reused for connection pooling.
+        """
+        if self._session is None:
+            timeout = httpx.Timeout(
+                connect=self._connect_timeout,
+                read=self._read_timeout,
+                write=30.0,
+                pool=5.0,
+            )
+            limits = httpx.Limits(
+                max_connections=self._max_connections,
+                max_keepalive_connections=self._max_keepalive_connections,
+                keepalive_expiry=30.0,
+            )
+            headers = {
+                "Authorization": f"Bearer {self._oauth_token}",
+                "User-Agent": self._user_agent,
+                "Accept": "application/json",
+                "Content-Type": "application/json",
+            }
+            self._session = httpx.AsyncClient(
+                base_url=self._url,
+                verify=_get_ssl_context(self._http2) if self._verify is True else self._verify,
+                timeout=timeout,
+                limits=limits,
+                headers=headers,
+                http2=self._http2,
+                follow_redirects=True,
+            )
+        return self._session
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        params: Optional[dict[str, Any]] = None,
+        data: Any = None,
+        timeout: Optional[float] = None,
+    ) -> dict[str, Any]:
+        """
+        Send a request to the cloud API.
+
+        Args:
+            method: HTTP method (GET, POST, PUT, DELETE)
+            path: API endpoint path
+            params: Query parameters (None values are dropped)
+            data: Request body data (will be JSON-encoded)
+            timeout: Override default read timeout in seconds (optional)
+
+        Returns:
+            Response envelope containing:
+            - data: JSON response body
+            - http_status_code: HTTP status code
+            - response_time: Response time in seconds
+            - request_info: Request metadata (method, url, params, data)
+
+        Raises:
+            httpx.HTTPStatusError: For HTTP error responses
+            httpx.TimeoutException: If request times out
+            httpx.RequestError: For network errors
+        """
+        url = path
+        if params:
+            clean_params = {k: v for k, v in params.items() if v is not None}
+            if clean_params:
+                url = f"{path}?{urlencode(clean_params)}"
+
+        request_info: dict[str, Any] = {"method": method, "url": url, "params": params}
+        if method != "GET":
+            request_info["data"] = data
+
+        # Read-only mode: simulate write operations without touching the network
+        if self._read_only and method != "GET":
+            logger.info("READ-ONLY: Simulating %s %s", method, url)
+            return {
+                "data": {"status": 0, "message": "Simulated (read-only mode)"},
+                "http_status_code": 200,
+                "response_time": 0.001,
+                "request_info": request_info,
+            }
+
+        await self._refresh_token_if_needed()
+        session = self._get_session()
+        request_timeout = timeout if timeout is not None else self._read_timeout
+        # Encode the body once, outside the retry loop
+        content = _dumps(data) if method != "GET" and data is not None else None
+
+        logger.debug("%s %s", method, url)
+        self._active_requests += 1
+        self._total_requests += 1
+        try:
+            for attempt in range(self._max_retries + 1):
+                try:
+                    start_time = time.time()
+                    response = await session.request(
+                        method,
+                        url,
+                        content=content,
+                        timeout=request_timeout,
+                    )
+                    response_time = time.time() - start_time
+                    self._http_version = response.http_version
+                    response.raise_for_status()
+                    body = response.content
+                    return {
+                        # Empty bodies (e.g. 204 No Content) skip the decoder
+                        "data": _loads(body) if body else {},
+                        "http_status_code": response.status_code,
+                        "response_time": response_time,
+                        "request_info": request_info,
+                    }
+                except (httpx.TimeoutException, httpx.HTTPStatusError, httpx.RequestError) as e:
+                    if attempt >= self._max_retries or not self._is_retryable(e):
+                        raise
+                    delay = min(2**attempt, 30.0)
+                    logger.warning(
+                        "Cloud %s %s failed (attempt %d/%d), retrying in %.1fs: %s",
+                        method, path, attempt + 1, self._max_retries + 1, delay, e,
+                    )
+                    await asyncio.sleep(delay)
+        finally:
+            self._active_requests -= 1
+
+        # Unreachable: the loop either returns or raises
+        raise RuntimeError(f"{method} {path} failed without raising")
+
+    @staticmethod
+    def _is_retryable(error: Exception) -> bool:
+        """Whether an error is transient and worth retrying."""
+        if isinstance(error, httpx.HTTPStatusError):
+            return error.response.status_code in _RETRY_STATUS_CODES
+        if isinstance(error, httpx.ConnectError) and "certificate" in str(error).lower():
+            # SSL/certificate errors are permanent failures
+            return False
+        return True
+
+    async def get(
+        self,
+        path: str,
+        params: Optional[dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+    ) -> dict[str, Any]:
+        """Send GET request to cloud API."""
+        return await self.request("GET", path, params=params, timeout=timeout)
+
+    async def post(
+        self,
+        path: str,
+        data: Any = None,
+        params: Optional[dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+    ) -> dict[str, Any]:
+        """Send POST request to cloud API."""
+        return await self.request("POST", path, params=params, data=data, timeout=timeout)
+
+    async def put(
+        self,
+        path: str,
+        data: Any = None,
+        params: Optional[dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+    ) -> dict[str, Any]:
+        """Send PUT request to cloud API."""
+        return await self.request("PUT", path, params=params, data=data, timeout=timeout)
+
+    async def delete(
+        self,
+        path: str,
+        params: Optional[dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+    ) -> dict[str, Any]:
+        """Send DELETE request to cloud API."""
+        return await self.request("DELETE", path, params=params, timeout=timeout)
+
+    def get_connection_stats(self) -> dict[str, Any]:
+        """
+        Get connection pool statistics.
+
+        Returns:
+            Dictionary with connection pool metrics:
+                - http2_enabled: Whether HTTP/2 is enabled
+                - http_version: Protocol negotiated on the last response
+                  (None before the first request)
+                - max_connections: Maximum allowed connections
+                - max_keepalive_connections: Maximum keepalive connections
+                - active_requests: Number of currently in-flight requests
+                - total_requests: Total number of requests made
+                - client_active: Whether HTTP session is initialized
+        """
+        return {
+            "http2_enabled": self._http2,
+            "http_version": self._http_version,
+            "max_connections": self._max_connections,
+            "max_keepalive_connections": self._max_keepalive_connections,
+            "active_requests": self._active_requests,
+            "total_requests": self._total_requests,
+            "client_active": self._session is not None,
+        }
+
+    async def aclose(self) -> None:
+        """Close the HTTP session and release pooled connections."""
+        if self._session is not None:
+            await self._session.aclose()
+            self._session = None
+            logger.debug("Async cloud HTTP session closed")
+
+    async def __aenter__(self) -> AsyncCloudHTTPClient:
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        """Async context manager exit - closes HTTP session."""
+        await self.aclose()
+
+
+class AsyncFortiZTP:
+    """
+    Async FortiZTP Cloud API client.
+
+    ``asyncio`` peer of :class:`hfortix_fortiztp.FortiZTP`. Takes the same
+    authentication arguments; every endpoint method is a coroutine so
+    callers can ``asyncio.gather()`` independent requests and overlap their
+    network waits on one pooled HTTP/2 connection.
+
+    Args:
+        api_id: FortiCloud API ID (for auto-login)
+        password: FortiCloud password (for auto-login)
+        client_id: Client ID for OAuth authentication (default: fortiztp)
+        oauth_token: Pre-obtained OAuth token (alternative to api_id/password)
+        session: CloudSession for multi-service token management
+        base_url: API base URL (default: https://fortiztp.forticloud.com/public/api)
+        auth_url: OAuth token endpoint (optional - uses FortiCloud default)
+        token_cache: Reuse a token obtained for the same credentials in the last 30 minutes (default: True)
+        verify: Enable SSL certificate verification (default: True)
+        max_retries: Maximum number of retry attempts (default: 3)
+        connect_timeout: Connection timeout in seconds (default: 10.0)
+        read_timeout: Read timeout in seconds (default: 300.0)
+        max_connections: Maximum pooled connections to the API host (default: 100)
+        max_keepalive_connections: Idle keep-alive connections kept warm (default: 20)
+        http2: Multiplex concurrent requests over one HTTP/2 connection (default: True)
+        read_only: Enable read-only mode - simulate write operations (default: False)
+
+    Attributes:
+        api: Async V2 API endpoints (devices, scripts, fortimanagers, system)
+        devices: Direct access to async devices API
+        scripts: Direct access to async scripts API
+        fortimanagers: Direct access to async fortimanagers API
+        system: Direct access to async system API
+
+    Example:
+        >>> async with AsyncFortiZTP(oauth_token="...") as fz:
+        ...     status = await fz.system.get()
+        ...     devices = await asyncio.gather(
+        ...         *[fz.devices.get(device_sn=sn) for sn in serials]
+        ...     )
+
+    Note:
+        Rate limiting enforcement, circuit breaking and audit logging are
+        provided by the synchronous :class:`~hfortix_fortiztp.FortiZTP`
+        transport only.
+
+    Raises:
+        ValueError: If no authentication method provided
+    """
+
+    # Default OAuth client_id for FortiZTP
+    DEFAULT_CLIENT_ID = "fortiztp"
+
+    # Type hints for IDE autocomplete
+    api: AsyncV2API
+    devices: AsyncDevicesAPI
+    scripts: AsyncScriptsAPI
+    fortimanagers: AsyncFortiManagersAPI
+    system: AsyncSystemAPI
+
+    # Endpoint groups proxied from self.api by __getattr__
+    _API_ATTRS = frozenset({"devices", "scripts", "fortimanagers", "system"})
+
+    __slots__ = (
+        "_auth",
+        "_client",
+        "_session",
+        "_client_id",
+        "_base_url",
+        "api",
+        "devices",
+        "scripts",
+        "fortimanagers",
+        "system",
+    )
+
+    def __init__(
+        self,
+        api_id: Optional[str] = None,
+        password: Optional[str] = None,
+        client_id: Optional[str] = None,
+        oauth_token: Optional[str] = None,
+        session: Optional[CloudSession] = None,
+        base_url: str = "https://fortiztp.forticloud.com/public/api",
+        auth_url: Optional[str] = None,
+        token_cache: bool = True,
+        verify: bool = True,
+        max_retries: int = 3,
+        connect_timeout: float = 10.0,
+        read_timeout: float = 300.0,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        http2: bool = True,
+        read_only: bool = False,
+    ) -> None:
+        """Initialize async FortiZTP client with OAuth credentials."""
+        self._client_id = client_id if client_id is not None else self.DEFAULT_CLIENT_ID
+        self._session = session
+        self._base_url = base_url
+        self._auth: Optional[FortiCloudAuth] = None
+        token_callback: Optional[Callable[[], str]] = None
+
+        if session:
+            # CloudSession mode - get token from session
+            oauth_token = session.get_token(self._client_id)
+            if session._check_before_request:
+                token_callback = _TokenRefresher(session, self._client_id)
+        elif not oauth_token:
+            if not api_id or not password:
+                raise ValueError(
+                    "Either session, oauth_token, or (api_id and password) must be provided"
+                )
+            # Blocking initial login; later re-logins before the token
+            # expires run off the event loop (see _refresh_token_if_needed)
+            self._auth = FortiCloudAuth(
+                api_id=api_id,
+                password=password,
+                client_id=self._client_id,
+                auth_url=auth_url,
+            )
+            token_callback = _LoginRefresher(self._auth, use_cache=token_cache)
+            oauth_token = token_callback()
+
+        self._client = AsyncCloudHTTPClient(
+            url=base_url,
+            oauth_token=oauth_token,
+            verify=verify,
+            max_retries=max_retries,
+            connect_timeout=connect_timeout,
+            read_timeout=read_timeout,
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            http2=http2,
+            read_only=read_only,
+            token_callback=token_callback,
+        )
+
+        # Initialize API endpoints
+        from .api.v2 import AsyncV2API
+        self.api = AsyncV2API(self._client)
+
+        # devices, scripts, etc. are also exposed directly (see __getattr__)
+
+    def __getattr__(self, name: str) -> Any:
+        """Proxy devices/scripts/fortimanagers/system to the V2 API."""
+        if name in self._API_ATTRS:
+            value = getattr(self.api, name)
+            setattr(self, name, value)
+            return value
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
+    def get_connection_stats(self) -> dict[str, Any]:
+        """Get connection pool statistics from HTTP client."""
+        return self._client.get_connection_stats()
+
+    async def gather(self, *calls: Awaitable[T], concurrency: int = 20) -> list[T]:
+        """
+        Run endpoint calls concurrently over this client's connection.
+
+        Like ``asyncio.gather()``, but at most ``concurrency`` calls are in
+        flight at once, so a large batch becomes a steady stream of HTTP/2
+        streams on the pooled connection rather than one burst.
+
+        Args:
+            *calls: Endpoint coroutines, e.g. ``fz.devices.get(device_sn=sn)``
+            concurrency: Maximum calls in flight at once (default: 20)
+
+        Returns:
+            Results in the same order as calls
+
+        Raises:
+            ValueError: If concurrency is less than 1
+
+        Example:
+            >>> async with AsyncFortiZTP(api_id="...", password="...") as fz:
+            ...     status, devices, scripts = await fz.gather(
+            ...         fz.system.get(),
+            ...         fz.devices.list(),
+            ...         fz.scripts.scripts_list(),
+            ...     )
+        """
+        if concurrency < 1:
+            for call in calls:
+                # Don't leave the coroutines behind un-awaited
+                close = getattr(call, "close", None)
+                if close is not None:
+                    close()
+            raise ValueError(f"concurrency must be at least 1, got {concurrency}")
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def run(call: Awaitable[T]) -> T:
+            async with semaphore:
+                return await call
+
+        return list(await asyncio.gather(*[run(call) for call in calls]))
+
+    async def logout(self) -> None:
+        """
+        Close HTTP client connections.
+
+        Note:
+            OAuth token revocation should be handled separately.
+        """
+        await self._client.aclose()
+
+    async def __aenter__(self) -> AsyncFortiZTP:
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        """Async context manager exit - closes HTTP client."""
+        await self.logout()
+
+    def __repr__(self) -> str:
+        """String representation of async FortiZTP client."""
+        return f"AsyncFortiZTP(base_url='{self._base_url}')"
+
+
+__all__ = ["AsyncFortiZTP", "AsyncCloudHTTPClient"]
@@ -1,14 +1,16 @@
 """FortiZTP Cloud API V2."""
 
-from typing import TYPE_CHECKING
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, Optional
 
 if TYPE_CHECKING:
     from hfortix_core.http.cloud_client import CloudHTTPClient
+    from hfortix_fortiztp.aio import AsyncCloudHTTPClient
 
-from .devices import DevicesAPI
-from .fortimanagers import FortiManagersAPI
-from .scripts import ScriptsAPI
-from .system import SystemAPI
+    from .devices import AsyncDevicesAPI, DevicesAPI
+    from .fortimanagers import AsyncFortiManagersAPI, FortiManagersAPI
+    from .scripts import AsyncScriptsAPI, ScriptsAPI
+    from .system import AsyncSystemAPI, SystemAPI
 
 
 class V2API:
@@ -33,8 +35,14 @@ class V2API:
         >>> 
         >>> # Access system status
         >>> status = client.api.system.get_status()
+    
+    Note:
+        Endpoint groups are imported and constructed on first access, so a
+        script that only touches ``client.system`` never loads the others.
     """
 
+    __slots__ = ("_client", "_devices", "_scripts", "_fortimanagers", "_system")
+
     def __init__(self, client: "CloudHTTPClient") -> None:
         """
         Initialize V2 API with HTTP client.
@@ -43,11 +51,126 @@ class V2API:
             client: CloudHTTPClient instance for making HTTP requests
         """
         self._client = client
+        self._devices: Optional["DevicesAPI"] = None
+        self._scripts: Optional["ScriptsAPI"] = None
+        self._fortimanagers: Optional["FortiManagersAPI"] = None
+        self._system: Optional["SystemAPI"] = None
+
+    @property
+    def devices(self) -> "DevicesAPI":
+        """Device provisioning and management endpoints."""
+        if self._devices is None:
+            from .devices import DevicesAPI
+            self._devices = DevicesAPI(self._client)
+        return self._devices
+
+    @property
+    def scripts(self) -> "ScriptsAPI":
+        """Pre-run CLI script endpoints."""
+        if self._scripts is None:
+            from .scripts import ScriptsAPI
+            self._scripts = ScriptsAPI(self._client)
+        return self._scripts
+
+    @property
+    def fortimanagers(self) -> "FortiManagersAPI":
+        """FortiManager integration endpoints."""
+        if self._fortimanagers is None:
+            from .fortimanagers import FortiManagersAPI
+            self._fortimanagers = FortiManagersAPI(self._client)
+        return self._fortimanagers
+
+    @property
+    def system(self) -> "SystemAPI":
+        """System status endpoints."""
+        if self._system is None:
+            from .system import SystemAPI
+            self._system = SystemAPI(self._client)
+        return self._system
+
+
+class AsyncV2API:
+    """
+    FortiZTP Cloud API V2 endpoints (async).
+
+    Same layout as :class:`V2API`, but every endpoint method is a coroutine.
+
+    Example:
+        >>> from hfortix_fortiztp.aio import AsyncFortiZTP
+        >>> async with AsyncFortiZTP(api_id="...", password="...") as client:
+        ...     status = await client.api.system.get()
+    """
+
+    __slots__ = ("_client", "_devices", "_scripts", "_fortimanagers", "_system")
+
+    def __init__(self, client: "AsyncCloudHTTPClient") -> None:
+        """
+        Initialize async V2 API with HTTP client.
+
+        Args:
+            client: AsyncCloudHTTPClient instance for making HTTP requests
+        """
+        self._client = client
+        self._devices: Optional["AsyncDevicesAPI"] = None
+        self._scripts: Optional["AsyncScriptsAPI"] = None
+        self._fortimanagers: Optional["AsyncFortiManagersAPI"] = None
+        self._system: Optional["AsyncSystemAPI"] = None
+
+    @property
+    def devices(self) -> "AsyncDevicesAPI":
+        """Device provisioning and management endpoints."""
+        if self._devices is None:
+            from .devices import AsyncDevicesAPI
+            self._devices = AsyncDevicesAPI(self._client)
+        return self._devices
+
+    @property
+    def scripts(self) -> "AsyncScriptsAPI":
+        """Pre-run CLI script endpoints."""
+        if self._scripts is None:
+            from .scripts import AsyncScriptsAPI
+            self._scripts = AsyncScriptsAPI(self._client)
+        return self._scripts
+
+    @property
+    def fortimanagers(self) -> "AsyncFortiManagersAPI":
+        """FortiManager integration endpoints."""
+        if self._fortimanagers is None:
+            from .fortimanagers import AsyncFortiManagersAPI
+            self._fortimanagers = AsyncFortiManagersAPI(self._client)
+        return self._fortimanagers
+
+    @property
+    def system(self) -> "AsyncSystemAPI":
+        """System status endpoints."""
+        if self._system is None:
+            from .system import AsyncSystemAPI
+            self._system = AsyncSystemAPI(self._client)
+        return self._system
+
+
+# Endpoint group classes re-exported from their modules, imported on first
+# access (``from hfortix_fortiztp.api.v2 import DevicesAPI``) - see __getattr__
+_LAZY_CLASSES = {
+    "DevicesAPI": "devices",
+    "AsyncDevicesAPI": "devices",
+    "ScriptsAPI": "scripts",
+    "AsyncScriptsAPI": "scripts",
+    "FortiManagersAPI": "fortimanagers",
+    "AsyncFortiManagersAPI": "fortimanagers",
+    "SystemAPI": "system",
+    "AsyncSystemAPI": "system",
+}
+
 
-        self.devices = DevicesAPI(client)
-        self.scripts = ScriptsAPI(client)
-        self.fortimanagers = FortiManagersAPI(client)
-        self.system = SystemAPI(client)
+def __getattr__(name: str) -> Any:
+    """Import an endpoint group class from its module on first access."""
+    module = _LAZY_CLASSES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
 
 
-__all__ = ["V2API"]
+__all__ = ["V2API", "AsyncV2API"]
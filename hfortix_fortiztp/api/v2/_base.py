@@ -0,0 +1,60 @@
+"""Shared base for the FortiZTP V2 endpoint groups."""
+
+import time
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple, Union
+
+from hfortix_fortiztp.cache import _copy_response
+from hfortix_fortiztp.models import FortiZTPResponse
+
+if TYPE_CHECKING:
+    from hfortix_core.http.cloud_client import CloudHTTPClient
+    from hfortix_fortiztp.aio import AsyncCloudHTTPClient
+
+
+class _APIBase:
+    """
+    Base class for an endpoint group (devices, scripts, ...).
+
+    Holds the HTTP client the group's requests are sent through. Subclasses
+    declare ``__slots__ = ()`` and annotate ``_client`` with the concrete
+    (sync or async) client type.
+    """
+
+    __slots__ = ("_client",)
+
+    def __init__(self, client: Union["CloudHTTPClient", "AsyncCloudHTTPClient"]) -> None:
+        """Initialize endpoint group with HTTP client."""
+        self._client = client
+
+
+class _LastResponseAPI(_APIBase):
+    """
+    Base class for an endpoint group that remembers its last response.
+
+    Backs ``max_age=`` on endpoints that are polled often (e.g. system
+    status): a response at most max_age seconds old is returned again
+    instead of calling the API. Like the GET cache, every caller gets its
+    own shallow copy of the envelope and its ``data`` container.
+    """
+
+    __slots__ = ("_last",)
+
+    def __init__(self, client: Union["CloudHTTPClient", "AsyncCloudHTTPClient"]) -> None:
+        """Initialize endpoint group with HTTP client."""
+        super().__init__(client)
+        # (time.monotonic() when fetched, response envelope) for max_age lookups
+        self._last: Optional[Tuple[float, Dict[str, Any]]] = None
+
+    def _recent(self, max_age: Optional[float]) -> Optional[FortiZTPResponse]:
+        """Return a copy of the last response if it is at most max_age seconds old, else None."""
+        if max_age is None or self._last is None:
+            return None
+        fetched_at, last = self._last
+        if time.monotonic() - fetched_at > max_age:
+            return None
+        return FortiZTPResponse(_copy_response(last))
+
+    def _remember(self, response: Dict[str, Any]) -> None:
+        """Keep a copy of response for max_age lookups (not rate-limiter "dropped" placeholders)."""
+        if "http_status_code" in response:
+            self._last = (time.monotonic(), _copy_response(response))
@@ -4,25 +4,72 @@ FortiZTP Devices API.
 Auto-generated from schema - contains 5 endpoints.
 """
 
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+import asyncio
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Tuple
 
 if TYPE_CHECKING:
     from hfortix_core.http.cloud_client import CloudHTTPClient
+    from hfortix_fortiztp.aio import AsyncCloudHTTPClient
 
+from hfortix_fortiztp.api.v2._base import _APIBase
 from hfortix_fortiztp.models import FortiZTPResponse
 from hfortix_fortiztp.types import (
     DeviceType,
+    DeviceV2Data,
     ProvisionStatus,
     ProvisionTarget,
 )
 
 
-class DevicesAPI:
+# put() argument names -> API field names, used by provision_many()
+_KEY_MAP = {
+    "device_sn": "deviceSN",
+    "device_type": "deviceType",
+    "provision_status": "provisionStatus",
+    "provision_target": "provisionTarget",
+    "region": "region",
+    "external_controller_sn": "externalControllerSn",
+    "external_controller_ip": "externalControllerIp",
+    "platform": "platform",
+    "firmware_profile": "firmwareProfile",
+    "forti_manager_oid": "fortiManagerOid",
+    "script_oid": "scriptOid",
+    "use_default_script": "useDefaultScript",
+    "provisioning_timestamp": "provisioningTimestamp",
+    "provisioning_complete_timestamp": "provisioningCompleteTimestamp",
+}
+
+
+# Keys accepted in a provision_many() spec: put() argument names or API field names
+_SPEC_KEYS = frozenset(_KEY_MAP) | frozenset(_KEY_MAP.values())
+
+
+def _to_api_devices(specs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Convert put()-style device specs to API bodies (camelCase keys, None dropped).
+
+    Raises:
+        ValueError: If a spec has a key that is neither a put() argument
+            nor an API field name (e.g. a typo)
+    """
+    for spec in specs:
+        unknown = spec.keys() - _SPEC_KEYS
+        if unknown:
+            raise ValueError(f"Unknown device field(s): {', '.join(sorted(unknown))}")
+    return [
+        {_KEY_MAP.get(key, key): value for key, value in spec.items() if value is not None}
+        for spec in specs
+    ]
+
+
+class DevicesAPI(_APIBase):
     """Devices API endpoints."""
 
-    def __init__(self, client: "CloudHTTPClient") -> None:
-        """Initialize Devices API."""
-        self._client = client
+    __slots__ = ()
+
+    _client: "CloudHTTPClient"
 
     def list(
         self,
@@ -107,6 +154,39 @@ class DevicesAPI:
         return FortiZTPResponse(response)
 
 
+    def provision_many(
+        self,
+        specs: List[Dict[str, Any]],
+    ) -> FortiZTPResponse:
+        """
+        Provision/unprovision many devices in one request.
+
+        Takes the same fields as :meth:`put` (snake_case argument names;
+        camelCase API names are passed through unchanged) and sends them as
+        a single :meth:`bulk_provision` call instead of one PUT per device.
+
+        Args:
+            specs: One dict per device, e.g. ``{"device_sn": "FGT...",
+                "device_type": "FortiGate", "provision_status": "provisioned"}``;
+                None values are omitted
+
+        Returns:
+            FortiZTPResponse for the whole batch
+
+        Raises:
+            ValueError: If a spec has an unknown field name
+
+        Example:
+            >>> response = client.api.devices.provision_many([
+            ...     {"device_sn": sn, "device_type": "FortiGate",
+            ...      "provision_status": "provisioned",
+            ...      "provision_target": "FortiManager", "forti_manager_oid": 12}
+            ...     for sn in serials
+            ... ])
+        """
+        return self.bulk_provision(_to_api_devices(specs))
+
+
     def get(
         self,
         device_sn: str,
@@ -135,10 +215,8 @@ class DevicesAPI:
         # Build path with parameters
         path = f"/v2/devices/{device_sn}"
 
-        # Build query parameters
-        params = {}
-        if use_cache is not None:
-            params['useCache'] = use_cache
+        # Build query parameters (None - no query string - in the common case)
+        params = {'useCache': use_cache} if use_cache is not None else None
 
         # Make HTTP request
         response = self._client.get(path, params=params)
@@ -147,6 +225,176 @@ class DevicesAPI:
         return FortiZTPResponse(response)
 
 
+    def get_many(
+        self,
+        device_sns: List[str],
+        use_cache: Optional[bool] = None,
+    ) -> FortiZTPResponse:
+        """
+        Get provisioning status for many devices in one request.
+
+        Uses the comma-separated deviceSN filter of :meth:`list`, so N
+        devices cost one round trip and one response instead of N. For very
+        large lists use :meth:`iter_devices`, which splits them into batches.
+
+        Args:
+            device_sns: Device serial numbers (required)
+            use_cache: Use cached data (optional)
+
+        Returns:
+            FortiZTPResponse with the matching devices in ``["data"]``
+
+        Raises:
+            ValueError: If device_sns is empty (an empty deviceSN filter
+                would match every device in the account)
+
+        Example:
+            >>> response = client.api.devices.get_many(["FGT1...", "FGT2..."])
+            >>> for device in response["data"]["data"]:
+            ...     print(device["deviceSN"], device["provisionStatus"])
+        """
+        if not device_sns:
+            raise ValueError("device_sns must not be empty")
+        return self.list(device_sn=",".join(device_sns), use_cache=use_cache)
+
+
+    def bulk_get(
+        self,
+        device_sns: List[str],
+        use_cache: Optional[bool] = None,
+        concurrency: int = 20,
+    ) -> List[FortiZTPResponse]:
+        """
+        Get provisioning status for many devices concurrently.
+
+        Fans the per-device :meth:`get` calls out over a thread pool sharing
+        this client's HTTP/2 connection pool, instead of paying one
+        round-trip per serial number in sequence. Unlike a temporary async
+        client, this also works when called from inside a running event
+        loop (it blocks that loop, like any other synchronous call).
+
+        Args:
+            device_sns: Device serial numbers (required)
+            use_cache: Use cached data (optional)
+            concurrency: Maximum requests in flight at once (default: 20)
+
+        Returns:
+            List of FortiZTPResponse objects, in the same order as device_sns
+
+        Raises:
+            ValueError: If concurrency is less than 1
+
+        Note:
+            Throughput is still bounded by the FortiZTP rate limit
+            (2,000 calls/hour). When one combined response is enough, prefer
+            :meth:`get_many`, which costs a single round trip.
+
+        Example:
+            >>> responses = client.api.devices.bulk_get(["FGT1...", "FGT2..."])
+            >>> print([r.http_status_code for r in responses])
+        """
+        if concurrency < 1:
+            raise ValueError(f"concurrency must be at least 1, got {concurrency}")
+        if not device_sns:
+            return []
+
+        # Open the HTTP session up front so worker threads don't race to create it
+        self._client._get_session()
+        with ThreadPoolExecutor(
+            max_workers=min(concurrency, len(device_sns)),
+            thread_name_prefix="fortiztp-devices",
+        ) as executor:
+            return list(executor.map(lambda sn: self.get(sn, use_cache=use_cache), device_sns))
+
+
+    def iter_devices(
+        self,
+        device_sns: Optional[List[str]] = None,
+        provision_status: Optional[ProvisionStatus] = None,
+        device_type: Optional[DeviceType] = None,
+        use_cache: Optional[bool] = None,
+        page_size: int = 100,
+        prefetch: int = 1,
+    ) -> Iterator[DeviceV2Data]:
+        """
+        Iterate over devices one at a time.
+
+        The devices endpoint has no offset/limit paging, so when device_sns
+        is given it is split into batches of page_size serial numbers, each
+        fetched with one list() call (comma-separated deviceSN filter).
+        While a batch is being consumed, the next one is already requested
+        on a background thread, overlapping network latency with the
+        caller's processing and holding at most prefetch + 1 batches in
+        memory. Without device_sns a single list() call is made.
+
+        Args:
+            device_sns: Device serial numbers to fetch (optional - all devices)
+            provision_status: Filter by provision status (optional)
+            device_type: Filter by device type (optional)
+            use_cache: Use cached data (optional)
+            page_size: Serial numbers per request (default: 100)
+            prefetch: Batches requested ahead of the one being consumed;
+                0 disables background fetching (default: 1)
+
+        Yields:
+            Device data dicts, in batch order
+
+        Raises:
+            RuntimeError: If a batch request returns no HTTP response (e.g.
+                it was dropped by the client-side rate limiter), rather than
+                silently yielding no devices for it
+
+        Example:
+            >>> for device in client.api.devices.iter_devices(serials):
+            ...     print(device["deviceSN"], device["provisionStatus"])
+        """
+        if device_sns is None:
+            batches: List[Optional[str]] = [None]
+        else:
+            batches = [
+                ",".join(device_sns[i:i + page_size])
+                for i in range(0, len(device_sns), page_size)
+            ]
+
+        def fetch(device_sn: Optional[str]) -> List[DeviceV2Data]:
+            response = self.list(
+                provision_status=provision_status,
+                device_type=device_type,
+                device_sn=device_sn,
+                use_cache=use_cache,
+            )
+            if "http_status_code" not in response:
+                # No HTTP response at all (e.g. dropped by the client-side rate
+                # limiter) - don't mistake the placeholder for an empty batch
+                raise RuntimeError(
+                    f"Device list request got no response: {response.get('message', response.raw)}"
+                )
+            body = response.get("data") or {}
+            return body.get("data") or []
+
+        if prefetch < 1 or len(batches) < 2:
+            for batch in batches:
+                yield from fetch(batch)
+            return
+
+        # Open the HTTP session up front so worker threads don't race to create it
+        self._client._get_session()
+        executor = ThreadPoolExecutor(max_workers=prefetch, thread_name_prefix="fortiztp-devices")
+        try:
+            # The batch being consumed plus up to prefetch batches ahead of it
+            pending = deque(executor.submit(fetch, batch) for batch in batches[:prefetch + 1])
+            next_batch = len(pending)
+            while pending:
+                yield from pending.popleft().result()
+                # Only queue the next batch once the current one is released
+                if next_batch < len(batches):
+                    pending.append(executor.submit(fetch, batches[next_batch]))
+                    next_batch += 1
+        finally:
+            # Don't block an abandoned iteration on batches nobody will read
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
     def put(
         self,
         device_sn: str,
@@ -200,10 +448,11 @@ class DevicesAPI:
         path = f"/v2/devices/{device_sn}"
 
         # Build request body
-        data = {}
-        data['deviceSN'] = device_sn
-        data['deviceType'] = device_type
-        data['provisionStatus'] = provision_status
+        data: Dict[str, Any] = {
+            'deviceSN': device_sn,
+            'deviceType': device_type,
+            'provisionStatus': provision_status,
+        }
         if provision_target is not None:
             data['provisionTarget'] = provision_target
         if region is not None:
@@ -269,4 +518,215 @@ class DevicesAPI:
         return FortiZTPResponse(response)
 
 
-__all__ = ["DevicesAPI"]
+class AsyncDevicesAPI(_APIBase):
+    """Devices API endpoints (async variant of :class:`DevicesAPI`)."""
+
+    __slots__ = ()
+
+    _client: "AsyncCloudHTTPClient"
+
+    async def list(
+        self,
+        provision_status: Optional[ProvisionStatus] = None,
+        device_type: Optional[DeviceType] = None,
+        device_sn: Optional[str] = None,
+        use_cache: Optional[bool] = None,
+    ) -> FortiZTPResponse:
+        """Get devices provisioning status. See :meth:`DevicesAPI.list`."""
+        path = "/v2/devices"
+
+        # Build query parameters
+        params: Dict[str, Any] = {}
+        if provision_status is not None:
+            params['provisionStatus'] = provision_status
+        if device_type is not None:
+            params['deviceType'] = device_type
+        if device_sn is not None:
+            params['deviceSN'] = device_sn
+        if use_cache is not None:
+            params['useCache'] = use_cache
+
+        response = await self._client.get(path, params=params)
+        return FortiZTPResponse(response)
+
+    async def bulk_provision(
+        self,
+        devices: List[Dict[str, Any]],
+    ) -> FortiZTPResponse:
+        """Provision/Unprovision devices. See :meth:`DevicesAPI.bulk_provision`."""
+        path = "/v2/devices"
+
+        response = await self._client.put(path, data=devices)
+        return FortiZTPResponse(response)
+
+    async def provision_many(
+        self,
+        specs: List[Dict[str, Any]],
+    ) -> FortiZTPResponse:
+        """Provision/unprovision many devices in one request. See :meth:`DevicesAPI.provision_many`."""
+        return await self.bulk_provision(_to_api_devices(specs))
+
+    async def get(
+        self,
+        device_sn: str,
+        use_cache: Optional[bool] = None,
+    ) -> FortiZTPResponse:
+        """Get specific device provisioning status. See :meth:`DevicesAPI.get`."""
+        path = f"/v2/devices/{device_sn}"
+
+        # Build query parameters (None - no query string - in the common case)
+        params = {'useCache': use_cache} if use_cache is not None else None
+
+        response = await self._client.get(path, params=params)
+        return FortiZTPResponse(response)
+
+    async def get_many(
+        self,
+        device_sns: List[str],
+        use_cache: Optional[bool] = None,
+    ) -> FortiZTPResponse:
+        """Get provisioning status for many devices in one request. See :meth:`DevicesAPI.get_many`."""
+        if not device_sns:
+            raise ValueError("device_sns must not be empty")
+        return await self.list(device_sn=",".join(device_sns), use_cache=use_cache)
+
+    async def bulk_get(
+        self,
+        device_sns: List[str],
+        use_cache: Optional[bool] = None,
+        concurrency: int = 20,
+    ) -> List[FortiZTPResponse]:
+        """
+        Get provisioning status for many devices concurrently.
+
+        At most ``concurrency`` requests are in flight at once; results are
+        returned in the same order as device_sns.
+
+        Raises:
+            ValueError: If concurrency is less than 1
+        """
+        if concurrency < 1:
+            raise ValueError(f"concurrency must be at least 1, got {concurrency}")
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch(device_sn: str) -> FortiZTPResponse:
+            async with semaphore:
+                return await self.get(device_sn, use_cache=use_cache)
+
+        return list(await asyncio.gather(*[fetch(sn) for sn in device_sns]))
+
+    async def put(
+        self,
+        device_sn: str,
+        device_type: DeviceType,
+        provision_status: ProvisionStatus,
+        provision_target: Optional[ProvisionTarget] = None,
+        region: Optional[str] = None,
+        external_controller_sn: Optional[str] = None,
+        external_controller_ip: Optional[str] = None,
+        platform: Optional[str] = None,
+        firmware_profile: Optional[str] = None,
+        forti_manager_oid: Optional[int] = None,
+        script_oid: Optional[int] = None,
+        use_default_script: Optional[bool] = None,
+        provisioning_timestamp: Optional[int] = None,
+        provisioning_complete_timestamp: Optional[int] = None,
+    ) -> FortiZTPResponse:
+        """Provision/Unprovision device. See :meth:`DevicesAPI.put`."""
+        path = f"/v2/devices/{device_sn}"
+
+        # Build request body
+        data: Dict[str, Any] = {
+            'deviceSN': device_sn,
+            'deviceType': device_type,
+            'provisionStatus': provision_status,
+        }
+        if provision_target is not None:
+            data['provisionTarget'] = provision_target
+        if region is not None:
+            data['region'] = region
+        if external_controller_sn is not None:
+            data['externalControllerSn'] = external_controller_sn
+        if external_controller_ip is not None:
+            data['externalControllerIp'] = external_controller_ip
+        if platform is not None:
+            data['platform'] = platform
+        if firmware_profile is not None:
+            data['firmwareProfile'] = firmware_profile
+        if forti_manager_oid is not None:
+            data['fortiManagerOid'] = forti_manager_oid
+        if script_oid is not None:
+            data['scriptOid'] = script_oid
+        if use_default_script is not None:
+            data['useDefaultScript'] = use_default_script
+        if provisioning_timestamp is not None:
+            data['provisioningTimestamp'] = provisioning_timestamp
+        if provisioning_complete_timestamp is not None:
+            data['provisioningCompleteTimestamp'] = provisioning_complete_timestamp
+
+        response = await self._client.put(path, data=data)
+        return FortiZTPResponse(response)
+
+    async def firmware_profiles(
+        self,
+        device_sn: str,
+        region: str,
+    ) -> FortiZTPResponse:
+        """Get firmware profiles for specific device. See :meth:`DevicesAPI.firmware_profiles`."""
+        path = f"/v2/devices/{device_sn}/regions/{region}/firmwareprofiles"
+
+        response = await self._client.get(path)
+        return FortiZTPResponse(response)
+
+    async def gather_firmware_profiles(
+        self,
+        pairs: List[Tuple[str, str]],
+        concurrency: int = 20,
+    ) -> List[FortiZTPResponse]:
+        """
+        Get firmware profiles for many (device_sn, region) pairs concurrently.
+
+        At most ``concurrency`` requests are in flight at once; results are
+        returned in the same order as pairs.
+
+        Raises:
+            ValueError: If concurrency is less than 1
+
+        Example:
+            >>> responses = await fz.devices.gather_firmware_profiles(
+            ...     [(sn, "global") for sn in serials]
+            ... )
+        """
+        if concurrency < 1:
+            raise ValueError(f"concurrency must be at least 1, got {concurrency}")
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch(device_sn: str, region: str) -> FortiZTPResponse:
+            async with semaphore:
+                return await self.firmware_profiles(device_sn, region)
+
+        return list(await asyncio.gather(*[fetch(sn, region) for sn, region in pairs]))
+
+    async def firmware_profiles_many(
+        self,
+        device_sn: str,
+        regions: List[str],
+    ) -> List[FortiZTPResponse]:
+        """
+        Get firmware profiles for one device in several regions concurrently.
+
+        All regions are requested at once, so the total wait is about one
+        round trip instead of one per region. Results are returned in the
+        same order as regions.
+
+        Example:
+            >>> responses = await fz.devices.firmware_profiles_many(
+            ...     "FGT60F...", ["global", "europe", "japan"]
+            ... )
+        """
+        return await self.gather_firmware_profiles(
+            [(device_sn, region) for region in regions], concurrency=max(len(regions), 1)
+        )
+
+
+__all__ = ["DevicesAPI", "AsyncDevicesAPI"]
@@ -4,25 +4,22 @@ FortiZTP Fortimanagers API.
 Auto-generated from schema - contains 5 endpoints.
 """
 
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, Optional
 
 if TYPE_CHECKING:
     from hfortix_core.http.cloud_client import CloudHTTPClient
+    from hfortix_fortiztp.aio import AsyncCloudHTTPClient
 
+from hfortix_fortiztp.api.v2._base import _APIBase
 from hfortix_fortiztp.models import FortiZTPResponse
-from hfortix_fortiztp.types import (
-    DeviceType,
-    ProvisionStatus,
-    ProvisionTarget,
-)
 
 
-class FortiManagersAPI:
+class FortiManagersAPI(_APIBase):
     """Fortimanagers API endpoints."""
 
-    def __init__(self, client: "CloudHTTPClient") -> None:
-        """Initialize Fortimanagers API."""
-        self._client = client
+    __slots__ = ()
+
+    _client: "CloudHTTPClient"
 
     def fortimanagers_get(
         self,
@@ -92,11 +89,7 @@ class FortiManagersAPI:
         path = f"/v2/setting/fortimanagers/{oid}"
 
         # Build request body
-        data = {}
-        if oid is not None:
-            data['oid'] = oid
-        data['sn'] = sn
-        data['ip'] = ip
+        data: Dict[str, Any] = {'oid': oid, 'sn': sn, 'ip': ip}
         if script_oid is not None:
             data['scriptOid'] = script_oid
         if update_time is not None:
@@ -204,11 +197,9 @@ class FortiManagersAPI:
         path = "/v2/setting/fortimanagers"
 
         # Build request body
-        data = {}
+        data: Dict[str, Any] = {'sn': sn, 'ip': ip}
         if oid is not None:
             data['oid'] = oid
-        data['sn'] = sn
-        data['ip'] = ip
         if script_oid is not None:
             data['scriptOid'] = script_oid
         if update_time is not None:
@@ -221,4 +212,85 @@ class FortiManagersAPI:
         return FortiZTPResponse(response)
 
 
-__all__ = ["FortiManagersAPI"]
+class AsyncFortiManagersAPI(_APIBase):
+    """Fortimanagers API endpoints (async variant of :class:`FortiManagersAPI`)."""
+
+    __slots__ = ()
+
+    _client: "AsyncCloudHTTPClient"
+
+    async def fortimanagers_get(
+        self,
+        oid: int,
+    ) -> FortiZTPResponse:
+        """Get specific FortiManager data. See :meth:`FortiManagersAPI.fortimanagers_get`."""
+        path = f"/v2/setting/fortimanagers/{oid}"
+
+        response = await self._client.get(path)
+        return FortiZTPResponse(response)
+
+    async def fortimanagers_put(
+        self,
+        oid: int,
+        sn: str,
+        ip: str,
+        script_oid: Optional[int] = None,
+        update_time: Optional[int] = None,
+    ) -> FortiZTPResponse:
+        """Update specific FortiManager data. See :meth:`FortiManagersAPI.fortimanagers_put`."""
+        path = f"/v2/setting/fortimanagers/{oid}"
+
+        # Build request body
+        data: Dict[str, Any] = {'oid': oid, 'sn': sn, 'ip': ip}
+        if script_oid is not None:
+            data['scriptOid'] = script_oid
+        if update_time is not None:
+            data['updateTime'] = update_time
+
+        response = await self._client.put(path, data=data)
+        return FortiZTPResponse(response)
+
+    async def fortimanagers_delete(
+        self,
+        oid: int,
+    ) -> FortiZTPResponse:
+        """Delete FortiManager data. See :meth:`FortiManagersAPI.fortimanagers_delete`."""
+        path = f"/v2/setting/fortimanagers/{oid}"
+
+        response = await self._client.delete(path)
+        return FortiZTPResponse(response)
+
+    async def fortimanagers_list(
+        self,
+    ) -> FortiZTPResponse:
+        """Get FortiManager data. See :meth:`FortiManagersAPI.fortimanagers_list`."""
+        path = "/v2/setting/fortimanagers"
+
+        response = await self._client.get(path)
+        return FortiZTPResponse(response)
+
+    async def fortimanagers_post(
+        self,
+        sn: str,
+        ip: str,
+        oid: Optional[int] = None,
+        script_oid: Optional[int] = None,
+        update_time: Optional[int] = None,
+    ) -> FortiZTPResponse:
+        """Add FortiManager data. See :meth:`FortiManagersAPI.fortimanagers_post`."""
+        path = "/v2/setting/fortimanagers"
+
+        # Build request body
+        data: Dict[str, Any] = {'sn': sn, 'ip': ip}
+        if oid is not None:
+            data['oid'] = oid
+        if script_oid is not None:
+            data['scriptOid'] = script_oid
+        if update_time is not None:
+            data['updateTime'] = update_time
+
+        response = await self._client.post(path, data=data)
+        return FortiZTPResponse(response)
+
+
+__all__ = ["FortiManagersAPI", "AsyncFortiManagersAPI"]
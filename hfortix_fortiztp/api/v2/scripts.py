@@ -4,25 +4,22 @@ FortiZTP Scripts API.
 Auto-generated from schema - contains 7 endpoints.
 """
 
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, Optional
 
 if TYPE_CHECKING:
     from hfortix_core.http.cloud_client import CloudHTTPClient
+    from hfortix_fortiztp.aio import AsyncCloudHTTPClient
 
+from hfortix_fortiztp.api.v2._base import _APIBase
 from hfortix_fortiztp.models import FortiZTPResponse
-from hfortix_fortiztp.types import (
-    DeviceType,
-    ProvisionStatus,
-    ProvisionTarget,
-)
 
 
-class ScriptsAPI:
+class ScriptsAPI(_APIBase):
     """Scripts API endpoints."""
 
-    def __init__(self, client: "CloudHTTPClient") -> None:
-        """Initialize Scripts API."""
-        self._client = client
+    __slots__ = ()
+
+    _client: "CloudHTTPClient"
 
     def scripts_get(
         self,
@@ -88,9 +85,7 @@ class ScriptsAPI:
         path = f"/v2/setting/scripts/{oid}"
 
         # Build request body
-        data = {}
-        data['oid'] = oid
-        data['name'] = name
+        data: Dict[str, Any] = {'oid': oid, 'name': name}
         if update_time is not None:
             data['updateTime'] = update_time
 
@@ -192,9 +187,7 @@ class ScriptsAPI:
         path = "/v2/setting/scripts"
 
         # Build request body
-        data = {}
-        data['oid'] = oid
-        data['name'] = name
+        data: Dict[str, Any] = {'oid': oid, 'name': name}
         if update_time is not None:
             data['updateTime'] = update_time
 
@@ -274,4 +267,95 @@ class ScriptsAPI:
         return FortiZTPResponse(response)
 
 
-__all__ = ["ScriptsAPI"]
+class AsyncScriptsAPI(_APIBase):
+    """Scripts API endpoints (async variant of :class:`ScriptsAPI`)."""
+
+    __slots__ = ()
+
+    _client: "AsyncCloudHTTPClient"
+
+    async def scripts_get(
+        self,
+        oid: int,
+    ) -> FortiZTPResponse:
+        """Get specific script meta data. See :meth:`ScriptsAPI.scripts_get`."""
+        path = f"/v2/setting/scripts/{oid}"
+
+        response = await self._client.get(path)
+        return FortiZTPResponse(response)
+
+    async def scripts_put(
+        self,
+        oid: int,
+        name: str,
+        update_time: Optional[int] = None,
+    ) -> FortiZTPResponse:
+        """Update specific script meta data. See :meth:`ScriptsAPI.scripts_put`."""
+        path = f"/v2/setting/scripts/{oid}"
+
+        # Build request body
+        data: Dict[str, Any] = {'oid': oid, 'name': name}
+        if update_time is not None:
+            data['updateTime'] = update_time
+
+        response = await self._client.put(path, data=data)
+        return FortiZTPResponse(response)
+
+    async def scripts_delete(
+        self,
+        oid: int,
+    ) -> FortiZTPResponse:
+        """Delete script. See :meth:`ScriptsAPI.scripts_delete`."""
+        path = f"/v2/setting/scripts/{oid}"
+
+        response = await self._client.delete(path)
+        return FortiZTPResponse(response)
+
+    async def scripts_list(
+        self,
+    ) -> FortiZTPResponse:
+        """Get scripts meta data. See :meth:`ScriptsAPI.scripts_list`."""
+        path = "/v2/setting/scripts"
+
+        response = await self._client.get(path)
+        return FortiZTPResponse(response)
+
+    async def scripts_post(
+        self,
+        oid: int,
+        name: str,
+        update_time: Optional[int] = None,
+    ) -> FortiZTPResponse:
+        """Add script meta data. See :meth:`ScriptsAPI.scripts_post`."""
+        path = "/v2/setting/scripts"
+
+        # Build request body
+        data: Dict[str, Any] = {'oid': oid, 'name': name}
+        if update_time is not None:
+            data['updateTime'] = update_time
+
+        response = await self._client.post(path, data=data)
+        return FortiZTPResponse(response)
+
+    async def scripts_get_content(
+        self,
+        oid: int,
+    ) -> FortiZTPResponse:
+        """Get script content. See :meth:`ScriptsAPI.scripts_get_content`."""
+        path = f"/v2/setting/scripts/{oid}/content"
+
+        response = await self._client.get(path)
+        return FortiZTPResponse(response)
+
+    async def scripts_put_content(
+        self,
+        oid: int,
+    ) -> FortiZTPResponse:
+        """Update specific script content. See :meth:`ScriptsAPI.scripts_put_content`."""
+        path = f"/v2/setting/scripts/{oid}/content"
+
+        response = await self._client.put(path, data=None)
+        return FortiZTPResponse(response)
+
+
+__all__ = ["ScriptsAPI", "AsyncScriptsAPI"]
@@ -4,34 +4,37 @@ FortiZTP System API.
 Auto-generated from schema - contains 1 endpoints.
 """
 
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Optional
 
 if TYPE_CHECKING:
     from hfortix_core.http.cloud_client import CloudHTTPClient
+    from hfortix_fortiztp.aio import AsyncCloudHTTPClient
 
+from hfortix_fortiztp.api.v2._base import _LastResponseAPI
 from hfortix_fortiztp.models import FortiZTPResponse
-from hfortix_fortiztp.types import (
-    DeviceType,
-    ProvisionStatus,
-    ProvisionTarget,
-)
 
 
-class SystemAPI:
+class SystemAPI(_LastResponseAPI):
     """System API endpoints."""
 
-    def __init__(self, client: "CloudHTTPClient") -> None:
-        """Initialize System API."""
-        self._client = client
+    __slots__ = ()
+
+    _client: "CloudHTTPClient"
 
     def get(
         self,
+        max_age: Optional[float] = None,
     ) -> FortiZTPResponse:
         """
         Get system status.
 
         Get system status
 
+        Args:
+            max_age: Reuse the last status if it is at most this many seconds
+                old, instead of calling the API - for frequent health probes
+                (optional; default: always call the API)
+
         Returns:
             FortiZTPResponse: Response object with:
             - .http_status_code: HTTP status code
@@ -43,13 +46,43 @@ class SystemAPI:
             >>> response = client.api.system.get(...)
             >>> print(response.http_status_code)
         """
+        last = self._recent(max_age)
+        if last is not None:
+            return last
+
         path = "/v2/system"
 
         # Make HTTP request
         response = self._client.get(path)
 
         # Wrap in FortiZTPResponse
-        return FortiZTPResponse(response)
+        result = FortiZTPResponse(response)
+        self._remember(response)
+        return result
+
+
+class AsyncSystemAPI(_LastResponseAPI):
+    """System API endpoints (async variant of :class:`SystemAPI`)."""
+
+    __slots__ = ()
+
+    _client: "AsyncCloudHTTPClient"
+
+    async def get(
+        self,
+        max_age: Optional[float] = None,
+    ) -> FortiZTPResponse:
+        """Get system status. See :meth:`SystemAPI.get`."""
+        last = self._recent(max_age)
+        if last is not None:
+            return last
+
+        path = "/v2/system"
+
+        response = await self._client.get(path)
+        result = FortiZTPResponse(response)
+        self._remember(response)
+        return result
 
 
-__all__ = ["SystemAPI"]
+__all__ = ["SystemAPI", "AsyncSystemAPI"]
@@ -0,0 +1,192 @@
+"""
+FortiZTP response cache.
+
+In-memory TTL + LRU cache for idempotent GET requests, and a thin wrapper
+around the HTTP client that serves repeated reads from it.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Optional
+
+if TYPE_CHECKING:
+    from hfortix_core.http.cloud_client import CloudHTTPClient
+
+
+def _copy_response(response: dict[str, Any]) -> dict[str, Any]:
+    """Shallow-copy a response envelope and its ``data`` container."""
+    copied = dict(response)
+    data = copied.get("data")
+    if isinstance(data, dict):
+        copied["data"] = dict(data)
+    elif isinstance(data, list):
+        copied["data"] = list(data)
+    return copied
+
+
+class ResponseCache:
+    """
+    Thread-safe TTL cache with LRU eviction for API response envelopes.
+
+    Args:
+        ttl: Seconds a cached response stays fresh (default: 60.0)
+        maxsize: Maximum number of cached responses (default: 256)
+
+    Example:
+        >>> cache = ResponseCache(ttl=30.0)
+        >>> key = cache.make_key("GET", "/v2/devices", {"deviceType": "FortiGate"})
+        >>> cache.get(key) is None
+        True
+    """
+
+    def __init__(self, ttl: float = 60.0, maxsize: int = 256) -> None:
+        """Initialize empty response cache."""
+        self._ttl = ttl
+        self._maxsize = maxsize
+        # key -> (expires_at, response); expires_at is a time.monotonic() deadline
+        self._entries: OrderedDict[tuple[Any, ...], tuple[float, dict[str, Any]]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    @staticmethod
+    def make_key(
+        method: str,
+        path: str,
+        params: Optional[dict[str, Any]] = None,
+    ) -> tuple[Any, ...]:
+        """
+        Build a cache key for a request.
+
+        None-valued params are ignored, matching how the HTTP client drops
+        them from the query string.
+        """
+        if not params:
+            return (method, path, frozenset())
+        return (method, path, frozenset((k, v) for k, v in params.items() if v is not None))
+
+    def get(self, key: tuple[Any, ...]) -> Optional[dict[str, Any]]:
+        """Return the cached response for key, or None if missing/expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            if time.monotonic() >= entry[0]:
+                del self._entries[key]
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry[1]
+
+    def set(self, key: tuple[Any, ...], response: dict[str, Any], ttl: Optional[float] = None) -> None:
+        """Store response under key for ttl seconds (default: cache TTL)."""
+        expires_at = time.monotonic() + (self._ttl if ttl is None else ttl)
+        with self._lock:
+            self._entries[key] = (expires_at, response)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached responses."""
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary containing:
+            - size: Number of cached responses
+            - maxsize: Maximum number of cached responses
+            - ttl: Default TTL in seconds
+            - hits: Lookups served from cache
+            - misses: Lookups that went to the network
+        """
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "maxsize": self._maxsize,
+                "ttl": self._ttl,
+                "hits": self._hits,
+                "misses": self._misses,
+            }
+
+    def __len__(self) -> int:
+        """Number of cached responses (including not yet evicted expired ones)."""
+        return len(self._entries)
+
+
+class CachingHTTPClient:
+    """
+    HTTP client wrapper that serves GET requests from a ResponseCache.
+
+    GET responses are cached per (path, params); any write (POST, PUT,
+    DELETE) clears the cache so later reads see the change. Requests with
+    ``useCache=False`` - the API's own "give me fresh data" flag - always
+    go to the network and are not cached. All other attributes are
+    delegated to the wrapped client.
+
+    Each caller gets its own shallow copy of the envelope and its ``data``
+    container, so adding, replacing or removing top-level keys doesn't
+    leak into later hits; objects nested deeper (e.g. individual device
+    dicts) are shared with the cache and should be treated as read-only.
+
+    Args:
+        client: CloudHTTPClient to wrap
+        cache: ResponseCache to read from and populate
+    """
+
+    def __init__(self, client: CloudHTTPClient, cache: ResponseCache) -> None:
+        """Initialize caching wrapper."""
+        self._client = client
+        self._cache = cache
+
+    def get(
+        self,
+        path: str,
+        params: Optional[dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+    ) -> dict[str, Any]:
+        """Send GET request, returning a cached response when fresh."""
+        if params and params.get("useCache") is False:
+            return self._client.get(path, params=params, timeout=timeout)
+
+        key = self._cache.make_key("GET", path, params)
+        cached = self._cache.get(key)
+        if cached is not None:
+            return _copy_response(cached)
+
+        response = self._client.get(path, params=params, timeout=timeout)
+        # Only cache real responses (not rate-limiter "dropped" placeholders)
+        if "http_status_code" in response:
+            self._cache.set(key, _copy_response(response))
+        return response
+
+    def post(self, path: str, data: Any = None, **kwargs: Any) -> dict[str, Any]:
+        """Send POST request and invalidate cached reads."""
+        self._cache.clear()
+        return self._client.post(path, data=data, **kwargs)
+
+    def put(self, path: str, data: Any = None, **kwargs: Any) -> dict[str, Any]:
+        """Send PUT request and invalidate cached reads."""
+        self._cache.clear()
+        return self._client.put(path, data=data, **kwargs)
+
+    def delete(self, path: str, **kwargs: Any) -> dict[str, Any]:
+        """Send DELETE request and invalidate cached reads."""
+        self._cache.clear()
+        return self._client.delete(path, **kwargs)
+
+    def __getattr__(self, name: str) -> Any:
+        """Delegate everything else to the wrapped client."""
+        return getattr(self._client, name)
+
+
+__all__ = ["ResponseCache", "CachingHTTPClient"]
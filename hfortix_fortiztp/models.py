@@ -48,6 +48,9 @@ class FortiZTPResponse:
         request_info: HTTP request information
     """
     
+    # One instance per API call - no per-instance __dict__
+    __slots__ = ("_data", "_http_status_code", "_response_time", "_request_info")
+    
     def __init__(
         self,
         data: dict[str, Any],
@@ -164,11 +167,12 @@ class FortiZTPResponse:
         Raises:
             AttributeError: If attribute not found in response data
         """
-        if name.startswith("_"):
-            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
-        
-        if name in self._data:
-            return self._data[name]
+        # Only reached after normal lookup fails; one dict lookup per hit
+        if not name.startswith("_"):
+            try:
+                return self._data[name]
+            except KeyError:
+                pass
         
         raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
     
@@ -198,11 +202,16 @@ class FortiZTPResponse:
     
     def __repr__(self) -> str:
         """String representation of response."""
-        status = f"status={self._http_status_code}" if self._http_status_code else ""
-        time = f"time={self._response_time:.3f}s" if self._response_time else ""
-        parts = [p for p in [status, time] if p]
-        metadata = f"({', '.join(parts)})" if parts else ""
-        return f"<{type(self).__name__}{metadata}>"
+        name = type(self).__name__
+        status = self._http_status_code
+        time = self._response_time
+        if status and time:
+            return f"<{name}(status={status}, time={time:.3f}s)>"
+        if status:
+            return f"<{name}(status={status})>"
+        if time:
+            return f"<{name}(time={time:.3f}s)>"
+        return f"<{name}>"
 
 
 __all__ = ["FortiZTPResponse"]
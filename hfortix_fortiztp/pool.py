@@ -0,0 +1,244 @@
+"""
+Shared HTTP clients and connection pools for FortiZTP.
+
+Session clients:
+    FortiZTP instances created from the same CloudSession, for the same
+    base URL and client_id and with the same connection settings, reuse a
+    single CloudHTTPClient - and therefore one keep-alive connection pool -
+    instead of each opening their own connections to the API host.
+
+    Shared clients are reference-counted: every FortiZTP that acquires one
+    must release it (``FortiZTP.logout()`` does this), and the connections
+    are only closed when the last user releases it. The statistics the
+    client records (retries, connections) are the combined activity of all
+    instances sharing it.
+
+Process-wide pool:
+    With ``FortiZTP(shared_pool=True)`` every client - whatever its token
+    or session - sends requests over one process-wide transport, so
+    clients created per worker thread reuse each other's keep-alive
+    connections instead of each doing its own TLS handshakes. The pool is
+    created with 50 connections on first use; call
+    ``get_shared_pool(maxsize=N)`` before creating any such client to size
+    it for N worker threads.
+
+SSL context:
+    Every verifying client, sync or async, uses one process-wide
+    SSLContext (``_get_ssl_context()``).
+"""
+
+import copy
+import ssl
+import threading
+import weakref
+from typing import Any, Callable, Optional
+
+import httpx
+from hfortix_core.http.cloud_client import CloudHTTPClient
+from hfortix_core.session import CloudSession
+
+
+# SSL contexts shared by every client that verifies certificates, so the CA
+# bundle is loaded once per process instead of once per client. Keyed by
+# HTTP/2 support: httpcore sets the context's ALPN protocols on connect,
+# so clients that disagree on h2 must not share one.
+_SSL_CONTEXTS: dict[bool, ssl.SSLContext] = {}
+_SSL_CONTEXTS_LOCK = threading.Lock()
+
+
+def _get_ssl_context(http2: bool = True) -> ssl.SSLContext:
+    """
+    Get the process-wide verifying SSL context.
+    
+    Args:
+        http2: Whether the client using it negotiates HTTP/2
+    
+    Returns:
+        SSLContext built like httpx's default (certifi CA bundle,
+        SSL_CERT_FILE/SSL_CERT_DIR honoured)
+    """
+    with _SSL_CONTEXTS_LOCK:
+        context = _SSL_CONTEXTS.get(http2)
+        if context is None:
+            context = _SSL_CONTEXTS[http2] = httpx.create_ssl_context()
+        return context
+
+
+class _SharedClient:
+    """Registry entry: a shared client, the settings it was built with, and its user count."""
+
+    __slots__ = ("client", "settings", "refcount")
+
+    def __init__(self, client: CloudHTTPClient, settings: dict[str, Any]) -> None:
+        self.client = client
+        self.settings = settings
+        self.refcount = 1
+
+
+def _snapshot(settings: dict[str, Any]) -> dict[str, Any]:
+    """Copy settings, deep-copying dict values (e.g. user_context) so later caller edits don't leak in."""
+    return {
+        name: copy.deepcopy(value) if isinstance(value, dict) else value
+        for name, value in settings.items()
+    }
+
+
+# session -> {(base_url, client_id): _SharedClient}
+_SESSION_CLIENTS: "weakref.WeakKeyDictionary[CloudSession, dict[tuple[str, str], _SharedClient]]" = (
+    weakref.WeakKeyDictionary()
+)
+_LOCK = threading.Lock()
+
+
+def acquire_session_client(
+    session: CloudSession,
+    base_url: str,
+    client_id: str,
+    settings: dict[str, Any],
+    factory: Callable[[], CloudHTTPClient],
+) -> tuple[CloudHTTPClient, bool]:
+    """
+    Get the shared HTTP client for (session, base_url, client_id).
+
+    Args:
+        session: CloudSession the client authenticates through
+        base_url: API base URL
+        client_id: OAuth client_id
+        settings: Connection/enforcement settings the client is built with;
+            a client is only shared between callers with equal settings
+            (compared against a copy taken when the client was created)
+        factory: Creates a new CloudHTTPClient when none can be shared
+
+    Returns:
+        Tuple of (client, shared). When shared is False the client is
+        private to the caller (settings differ from the shared one) and
+        should simply be closed with ``client.logout()``.
+    """
+    key = (base_url, client_id)
+    with _LOCK:
+        clients = _SESSION_CLIENTS.setdefault(session, {})
+        entry = clients.get(key)
+        if entry is None:
+            client = factory()
+            clients[key] = _SharedClient(client, _snapshot(settings))
+            return client, True
+        if entry.settings == settings:
+            entry.refcount += 1
+            return entry.client, True
+    # Same target but different settings (e.g. read_only) - don't share
+    return factory(), False
+
+
+def release_session_client(
+    session: CloudSession,
+    base_url: str,
+    client_id: str,
+) -> None:
+    """
+    Release one reference to a shared HTTP client.
+
+    Closes the client's connections when the last reference is released.
+    """
+    key = (base_url, client_id)
+    with _LOCK:
+        clients = _SESSION_CLIENTS.get(session)
+        if not clients:
+            return
+        entry = clients.get(key)
+        if entry is None:
+            return
+        entry.refcount -= 1
+        if entry.refcount > 0:
+            return
+        del clients[key]
+    entry.client.logout()
+
+
+class _SharedTransport(httpx.BaseTransport):
+    """Transport wrapper that ignores close(), so one client can't close the shared pool."""
+
+    def __init__(self, transport: httpx.HTTPTransport) -> None:
+        self._transport = transport
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        return self._transport.handle_request(request)
+
+    def close(self) -> None:
+        pass
+
+
+_SHARED_POOL: Optional[_SharedTransport] = None
+
+
+def get_shared_pool(maxsize: int = 50) -> httpx.BaseTransport:
+    """
+    Get the process-wide HTTP/2 transport used by ``shared_pool=True`` clients.
+
+    Created on first call; thread-safe (httpx/httpcore lock the pool
+    internally). Closing a client that uses it leaves the pool open.
+
+    Args:
+        maxsize: Maximum connections (and keep-alive connections) in the
+            pool - size it for the number of worker threads. Only used by
+            the first call, which creates the pool (default: 50)
+
+    Returns:
+        Shared transport to pass as ``httpx.Client(transport=...)``
+    """
+    global _SHARED_POOL
+    with _LOCK:
+        if _SHARED_POOL is None:
+            _SHARED_POOL = _SharedTransport(
+                httpx.HTTPTransport(
+                    verify=_get_ssl_context(),
+                    http2=True,
+                    limits=httpx.Limits(
+                        max_connections=maxsize,
+                        max_keepalive_connections=maxsize,
+                        keepalive_expiry=30.0,
+                    ),
+                )
+            )
+        return _SHARED_POOL
+
+
+class SharedPoolHTTPClient(CloudHTTPClient):
+    """
+    CloudHTTPClient that sends its requests over the process-wide pool.
+
+    Behaves exactly like CloudHTTPClient (retries, rate limiting, audit,
+    token refresh); only the connections come from ``get_shared_pool()``
+    instead of a pool owned by this client. The client's own
+    max_connections / max_keepalive_connections / verify settings are not
+    used for the shared connections.
+    """
+
+    def _get_session(self) -> httpx.Client:
+        """Get or create the httpx client bound to the shared transport."""
+        if self._session is None:
+            self._session = httpx.Client(
+                base_url=self._url,
+                timeout=httpx.Timeout(
+                    connect=self._connect_timeout,
+                    read=self._read_timeout,
+                    write=30.0,
+                    pool=5.0,
+                ),
+                headers={
+                    "Authorization": f"Bearer {self._oauth_token}",
+                    "User-Agent": self._user_agent,
+                    "Accept": "application/json",
+                    "Content-Type": "application/json",
+                },
+                transport=get_shared_pool(),
+                follow_redirects=True,
+            )
+        return self._session
+
+
+__all__ = [
+    "acquire_session_client",
+    "release_session_client",
+    "get_shared_pool",
+    "SharedPoolHTTPClient",
+]
@@ -0,0 +1,81 @@
+"""Shared fixtures for the hfortix_fortiztp test suite."""
+
+import asyncio
+import time
+
+import httpx
+import pytest
+from hfortix_core.http.cloud_client import CloudHTTPClient
+from hfortix_core.session import CloudSession, TokenInfo
+
+from hfortix_fortiztp.aio import AsyncCloudHTTPClient
+
+BASE_URL = "https://fortiztp.example.test/public/api"
+
+
+@pytest.fixture
+def no_sleep(monkeypatch):
+    """Make retry backoff sleeps return immediately, recording the delays."""
+    delays = []
+    real_sleep = asyncio.sleep
+
+    async def fake_sleep(delay, *args, **kwargs):
+        delays.append(delay)
+        await real_sleep(0)
+
+    monkeypatch.setattr("hfortix_fortiztp.aio.asyncio.sleep", fake_sleep)
+    return delays
+
+
+@pytest.fixture
+def async_client():
+    """Factory for an AsyncCloudHTTPClient whose requests go to a MockTransport handler."""
+
+    def make(handler, **kwargs):
+        kwargs.setdefault("oauth_token", "token-1")
+        client = AsyncCloudHTTPClient(url=BASE_URL, **kwargs)
+        client._session = httpx.AsyncClient(
+            base_url=BASE_URL,
+            transport=httpx.MockTransport(handler),
+            headers={
+                "Authorization": f"Bearer {client._oauth_token}",
+                "Content-Type": "application/json",
+            },
+        )
+        return client
+
+    return make
+
+
+@pytest.fixture
+def sync_client():
+    """Factory for a CloudHTTPClient whose requests go to a MockTransport handler."""
+
+    def make(handler, **kwargs):
+        kwargs.setdefault("oauth_token", "token-1")
+        client = CloudHTTPClient(url=BASE_URL, **kwargs)
+        client._session = httpx.Client(
+            base_url=BASE_URL,
+            transport=httpx.MockTransport(handler),
+            headers={
+                "Authorization": f"Bearer {client._oauth_token}",
+                "Content-Type": "application/json",
+            },
+        )
+        return client
+
+    return make
+
+
+@pytest.fixture
+def cloud_session():
+    """CloudSession with a valid "fortiztp" token already cached, so no login is attempted."""
+    session = CloudSession(api_id="api-id", password="secret")
+    session._tokens["fortiztp"] = TokenInfo(
+        access_token="token-1",
+        refresh_token="refresh-1",
+        expires_in=3600,
+        created_at=time.time(),
+    )
+    yield session
+    session.close()
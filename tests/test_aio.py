@@ -0,0 +1,197 @@
+"""Tests for the asyncio client (hfortix_fortiztp.aio)."""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from hfortix_fortiztp.aio import AsyncFortiZTP
+from hfortix_fortiztp.api.v2 import AsyncV2API
+
+
+def test_get_returns_envelope(async_client):
+    def handler(request):
+        assert request.url.path == "/public/api/v2/devices"
+        assert request.url.params["deviceType"] == "FortiGate"
+        return httpx.Response(200, json={"data": [], "total": 0})
+
+    client = async_client(handler)
+    response = asyncio.run(client.get("/v2/devices", params={"deviceType": "FortiGate", "x": None}))
+
+    assert response["data"] == {"data": [], "total": 0}
+    assert response["http_status_code"] == 200
+    assert response["request_info"]["method"] == "GET"
+    assert response["request_info"]["url"] == "/v2/devices?deviceType=FortiGate"
+
+
+def test_retries_on_503(async_client, no_sleep):
+    attempts = []
+
+    def handler(request):
+        attempts.append(request)
+        if len(attempts) < 3:
+            return httpx.Response(503)
+        return httpx.Response(200, json={"ok": True})
+
+    client = async_client(handler, max_retries=3)
+    response = asyncio.run(client.get("/v2/system"))
+
+    assert response["data"] == {"ok": True}
+    assert len(attempts) == 3
+    assert no_sleep == [1, 2]
+
+
+def test_raises_after_exhausting_retries(async_client, no_sleep):
+    attempts = []
+
+    def handler(request):
+        attempts.append(request)
+        return httpx.Response(503)
+
+    client = async_client(handler, max_retries=2)
+    with pytest.raises(httpx.HTTPStatusError):
+        asyncio.run(client.get("/v2/system"))
+
+    assert len(attempts) == 3
+    assert client.get_connection_stats()["active_requests"] == 0
+
+
+def test_does_not_retry_client_errors(async_client, no_sleep):
+    attempts = []
+
+    def handler(request):
+        attempts.append(request)
+        return httpx.Response(404)
+
+    client = async_client(handler)
+    with pytest.raises(httpx.HTTPStatusError):
+        asyncio.run(client.get("/v2/devices/UNKNOWN"))
+
+    assert len(attempts) == 1
+    assert no_sleep == []
+
+
+def test_read_only_simulates_writes(async_client):
+    def handler(request):
+        raise AssertionError(f"{request.method} sent in read-only mode")
+
+    client = async_client(handler, read_only=True)
+    response = asyncio.run(client.put("/v2/devices/FGT1", data={"deviceSN": "FGT1"}))
+
+    assert response["http_status_code"] == 200
+    assert response["data"]["message"] == "Simulated (read-only mode)"
+    assert response["request_info"]["data"] == {"deviceSN": "FGT1"}
+
+
+def test_read_only_still_sends_reads(async_client):
+    client = async_client(lambda request: httpx.Response(200, json={"ok": True}), read_only=True)
+
+    assert asyncio.run(client.get("/v2/system"))["data"] == {"ok": True}
+
+
+def test_empty_body_returns_empty_dict(async_client):
+    client = async_client(lambda request: httpx.Response(204))
+
+    response = asyncio.run(client.delete("/v2/setting/scripts/1"))
+
+    assert response["data"] == {}
+    assert response["http_status_code"] == 204
+
+
+def test_json_body_encoding(async_client):
+    sent = []
+
+    def handler(request):
+        sent.append(request)
+        return httpx.Response(200, json={})
+
+    client = async_client(handler)
+    body = [{"deviceSN": "FGT1", "provisionStatus": "provisioned", "fortiManagerOid": 12}]
+    asyncio.run(client.put("/v2/devices", data=body))
+
+    assert sent[0].method == "PUT"
+    assert sent[0].headers["Content-Type"] == "application/json"
+    assert json.loads(sent[0].content) == body
+
+
+def test_get_sends_no_body(async_client):
+    sent = []
+
+    def handler(request):
+        sent.append(request)
+        return httpx.Response(200, json={})
+
+    asyncio.run(async_client(handler).get("/v2/system"))
+
+    assert sent[0].content == b""
+
+
+def test_token_callback_refreshes_authorization_header(async_client):
+    tokens = iter(["token-1", "token-2"])
+    seen = []
+
+    def handler(request):
+        seen.append(request.headers["Authorization"])
+        return httpx.Response(200, json={})
+
+    client = async_client(handler, token_callback=lambda: next(tokens))
+
+    async def run():
+        await client.get("/v2/system")
+        await client.get("/v2/system")
+
+    asyncio.run(run())
+
+    assert seen == ["Bearer token-1", "Bearer token-2"]
+
+
+def test_async_fortiztp_requires_credentials():
+    with pytest.raises(ValueError):
+        AsyncFortiZTP()
+
+
+def test_async_fortiztp_endpoints(async_client):
+    def handler(request):
+        return httpx.Response(200, json={"path": request.url.path})
+
+    fz = AsyncFortiZTP(oauth_token="token-1")
+    fz._client = async_client(handler)
+    fz.api = AsyncV2API(fz._client)
+
+    response = asyncio.run(fz.devices.get("FGT1"))
+
+    assert response["data"] == {"path": "/public/api/v2/devices/FGT1"}
+
+
+def test_gather_preserves_order_and_limits_concurrency():
+    fz = AsyncFortiZTP(oauth_token="token-1")
+    in_flight = 0
+    peak = 0
+
+    async def call(value):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01 * (5 - value))
+        in_flight -= 1
+        return value
+
+    results = asyncio.run(fz.gather(*[call(i) for i in range(5)], concurrency=2))
+
+    assert results == [0, 1, 2, 3, 4]
+    assert peak == 2
+
+
+@pytest.mark.parametrize("concurrency", [0, -1])
+def test_gather_rejects_non_positive_concurrency(concurrency):
+    fz = AsyncFortiZTP(oauth_token="token-1")
+
+    async def call():
+        return 1
+
+    pending = call()
+    with pytest.raises(ValueError):
+        asyncio.run(fz.gather(pending, concurrency=concurrency))
+
+    assert pending.cr_frame is None  # closed, not left un-awaited
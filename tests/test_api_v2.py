@@ -0,0 +1,114 @@
+"""Tests for the hfortix_fortiztp.api.v2 package."""
+
+import asyncio
+import subprocess
+import sys
+
+import httpx
+import pytest
+
+
+@pytest.mark.parametrize("module, name", [
+    ("devices", "DevicesAPI"),
+    ("devices", "AsyncDevicesAPI"),
+    ("scripts", "ScriptsAPI"),
+    ("scripts", "AsyncScriptsAPI"),
+    ("fortimanagers", "FortiManagersAPI"),
+    ("fortimanagers", "AsyncFortiManagersAPI"),
+    ("system", "SystemAPI"),
+    ("system", "AsyncSystemAPI"),
+])
+def test_endpoint_classes_importable_from_package(module, name):
+    import importlib
+
+    import hfortix_fortiztp.api.v2 as v2
+
+    assert getattr(v2, name) is getattr(importlib.import_module(f"hfortix_fortiztp.api.v2.{module}"), name)
+
+
+def test_from_import():
+    from hfortix_fortiztp.api.v2 import DevicesAPI, FortiManagersAPI, ScriptsAPI, SystemAPI
+
+    assert [DevicesAPI.__name__, ScriptsAPI.__name__, FortiManagersAPI.__name__, SystemAPI.__name__] == [
+        "DevicesAPI", "ScriptsAPI", "FortiManagersAPI", "SystemAPI",
+    ]
+
+
+def test_unknown_attribute_raises():
+    import hfortix_fortiztp.api.v2 as v2
+
+    with pytest.raises(AttributeError):
+        v2.NoSuchAPI
+
+
+def test_endpoint_modules_load_on_first_access():
+    code = (
+        "import sys, hfortix_fortiztp.api.v2 as v2\n"
+        "assert 'hfortix_fortiztp.api.v2.devices' not in sys.modules\n"
+        "v2.DevicesAPI\n"
+        "assert 'hfortix_fortiztp.api.v2.devices' in sys.modules\n"
+        "assert 'hfortix_fortiztp.api.v2.scripts' not in sys.modules\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_system_get_max_age(sync_client, monkeypatch):
+    from hfortix_fortiztp.api.v2 import _base
+    from hfortix_fortiztp.api.v2.system import SystemAPI
+
+    now = [1000.0]
+    monkeypatch.setattr(_base.time, "monotonic", lambda: now[0])
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(200, json={"status": len(requests)})
+
+    system = SystemAPI(sync_client(handler))
+
+    assert system.get(max_age=30)["data"] == {"status": 1}
+    now[0] += 30
+    assert system.get(max_age=30)["data"] == {"status": 1}
+    assert system.get()["data"] == {"status": 2}
+    now[0] += 31
+    assert system.get(max_age=30)["data"] == {"status": 3}
+    assert len(requests) == 3
+
+
+def test_async_system_get_max_age(async_client):
+    from hfortix_fortiztp.api.v2.system import AsyncSystemAPI
+
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(200, json={"status": len(requests)})
+
+    system = AsyncSystemAPI(async_client(handler))
+
+    async def run():
+        first = await system.get(max_age=60)
+        second = await system.get(max_age=60)
+        return first, second
+
+    first, second = asyncio.run(run())
+
+    assert second.raw == first.raw
+    assert second.raw is not first.raw
+    assert len(requests) == 1
+
+
+def test_system_get_max_age_returns_independent_copies(sync_client):
+    from hfortix_fortiztp.api.v2.system import SystemAPI
+
+    system = SystemAPI(sync_client(lambda request: httpx.Response(200, json={"status": "ok"})))
+
+    first = system.get(max_age=60)
+    first.raw["http_status_code"] = 500
+    first["data"]["status"] = "changed"
+    second = system.get(max_age=60)
+    second["data"]["extra"] = True
+    third = system.get(max_age=60)
+
+    assert third["http_status_code"] == 200
+    assert third["data"] == {"status": "ok"}
@@ -0,0 +1,127 @@
+"""Tests for the response cache (hfortix_fortiztp.cache)."""
+
+import httpx
+import pytest
+
+import hfortix_fortiztp.cache
+from hfortix_fortiztp.cache import CachingHTTPClient, ResponseCache
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable time.monotonic() for cache expiry."""
+    now = [1000.0]
+    monkeypatch.setattr(hfortix_fortiztp.cache.time, "monotonic", lambda: now[0])
+    return now
+
+
+@pytest.fixture
+def counting_client(sync_client):
+    """CloudHTTPClient answering every request with a fresh body; requests are recorded."""
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(200, json={"data": [{"deviceSN": "FGT1"}], "total": len(requests)})
+
+    client = sync_client(handler)
+    client.requests = requests
+    return client
+
+
+def test_make_key_ignores_none_params():
+    assert ResponseCache.make_key("GET", "/v2/devices", {"a": 1, "b": None}) == ResponseCache.make_key(
+        "GET", "/v2/devices", {"a": 1}
+    )
+    assert ResponseCache.make_key("GET", "/v2/devices") == ResponseCache.make_key("GET", "/v2/devices", {})
+
+
+def test_entries_expire(clock):
+    cache = ResponseCache(ttl=10)
+    cache.set(("k",), {"data": 1})
+
+    clock[0] += 9
+    assert cache.get(("k",)) == {"data": 1}
+    clock[0] += 1
+    assert cache.get(("k",)) is None
+    assert cache.get_stats()["hits"] == 1
+    assert cache.get_stats()["misses"] == 1
+
+
+def test_lru_eviction():
+    cache = ResponseCache(maxsize=2)
+    cache.set(("a",), {})
+    cache.set(("b",), {})
+    cache.get(("a",))
+    cache.set(("c",), {})
+
+    assert cache.get(("b",)) is None
+    assert cache.get(("a",)) == {}
+    assert len(cache) == 2
+
+
+def test_repeated_get_served_from_cache(counting_client):
+    client = CachingHTTPClient(counting_client, ResponseCache())
+
+    first = client.get("/v2/devices", params={"deviceType": "FortiGate"})
+    second = client.get("/v2/devices", params={"deviceType": "FortiGate"})
+    other = client.get("/v2/devices", params={"deviceType": "FortiAP"})
+
+    assert len(counting_client.requests) == 2
+    assert first["data"] == second["data"]
+    assert other["data"]["total"] == 2
+
+
+def test_use_cache_false_bypasses_cache(counting_client):
+    client = CachingHTTPClient(counting_client, ResponseCache())
+
+    client.get("/v2/devices")
+    client.get("/v2/devices", params={"useCache": False})
+    client.get("/v2/devices", params={"useCache": False})
+
+    assert len(counting_client.requests) == 3
+
+
+def test_writes_invalidate_cache(counting_client):
+    client = CachingHTTPClient(counting_client, ResponseCache())
+
+    client.get("/v2/devices")
+    client.put("/v2/devices/FGT1", data={"provisionStatus": "provisioned"})
+    client.get("/v2/devices")
+
+    assert [r.method for r in counting_client.requests] == ["GET", "PUT", "GET"]
+
+
+def test_callers_get_independent_copies(counting_client):
+    client = CachingHTTPClient(counting_client, ResponseCache())
+
+    first = client.get("/v2/devices")
+    first["http_status_code"] = 500
+    first["data"]["total"] = 99
+    first["data"].pop("data")
+
+    second = client.get("/v2/devices")
+    second["data"]["extra"] = True
+
+    third = client.get("/v2/devices")
+
+    assert len(counting_client.requests) == 1
+    assert third["http_status_code"] == 200
+    assert third["data"] == {"data": [{"deviceSN": "FGT1"}], "total": 1}
+
+
+def test_dropped_responses_not_cached():
+    class DroppingClient:
+        calls = 0
+
+        def get(self, path, params=None, timeout=None):
+            self.calls += 1
+            return {"dropped": True}
+
+    inner = DroppingClient()
+    client = CachingHTTPClient(inner, ResponseCache())
+
+    client.get("/v2/devices")
+    client.get("/v2/devices")
+
+    assert inner.calls == 2
@@ -0,0 +1,69 @@
+"""Tests for the synchronous FortiZTP client."""
+
+import httpx
+import pytest
+from hfortix_core.http.cloud_client import CloudHTTPClient
+
+from hfortix_fortiztp import _SESSION_DEFAULTS, FortiZTP
+
+
+def test_rate_limit_status_counts_requests(sync_client):
+    fz = FortiZTP(oauth_token="token-1", rate_limit_calls_per_hour=2000)
+    http = sync_client(lambda request: httpx.Response(200, json={"deviceSN": "FGT1"}))
+    fz._client._session = http._session
+
+    fz.devices.get("FGT1")
+    fz.devices.get("FGT2")
+    status = fz.get_rate_limit_status()
+
+    assert status["calls_last_min"] == 2
+    assert status["calls_last_hour"] == 2
+    assert status["total_calls"] == 2
+    assert status["limits"]["calls_per_hour"] == 2000
+    assert status["within_limits"]
+
+
+@pytest.fixture
+def client_kwargs(monkeypatch):
+    """Record the keyword arguments FortiZTP builds its HTTP client with."""
+    calls = []
+
+    class RecordingClient(CloudHTTPClient):
+        def __init__(self, **kwargs):
+            calls.append(kwargs)
+            super().__init__(**kwargs)
+
+    monkeypatch.setattr("hfortix_fortiztp.CloudHTTPClient", RecordingClient)
+    return calls
+
+
+@pytest.fixture
+def limited_session(cloud_session):
+    """cloud_session with non-default rate limiting / circuit breaker settings."""
+    cloud_session._rate_limit = True
+    cloud_session._rate_limit_max_requests = 50
+    cloud_session._circuit_breaker = True
+    return cloud_session
+
+
+def test_enforcement_inherited_from_session(limited_session, client_kwargs):
+    FortiZTP(session=limited_session).logout()
+
+    assert client_kwargs[0]["rate_limit"] is True
+    assert client_kwargs[0]["rate_limit_max_requests"] == 50
+    assert client_kwargs[0]["circuit_breaker"] is True
+
+
+def test_explicit_default_wins_over_session(limited_session, client_kwargs):
+    FortiZTP(session=limited_session, rate_limit_max_requests=100, circuit_breaker=False).logout()
+
+    assert client_kwargs[0]["rate_limit_max_requests"] == 100
+    assert client_kwargs[0]["circuit_breaker"] is False
+    assert client_kwargs[0]["rate_limit"] is True
+
+
+def test_enforcement_defaults_without_session(client_kwargs):
+    FortiZTP(oauth_token="token-1", rate_limit_queue_size=10)
+
+    settings = {name: client_kwargs[0][name] for name in _SESSION_DEFAULTS}
+    assert settings == {**_SESSION_DEFAULTS, "rate_limit_queue_size": 10}
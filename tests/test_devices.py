@@ -0,0 +1,263 @@
+"""Tests for the Devices API helpers (bulk_get, iter_devices, get_many, provision_many)."""
+
+import asyncio
+import json
+import threading
+import time
+
+import httpx
+import pytest
+
+from hfortix_fortiztp.api.v2.devices import AsyncDevicesAPI, DevicesAPI
+
+
+def device_handler(request):
+    sn = request.url.path.rsplit("/", 1)[-1]
+    return httpx.Response(200, json={"deviceSN": sn, "provisionStatus": "provisioned"})
+
+
+def test_bulk_get_preserves_order(sync_client):
+    devices = DevicesAPI(sync_client(device_handler))
+
+    responses = devices.bulk_get([f"FGT{i}" for i in range(10)], concurrency=3)
+
+    assert [r["data"]["deviceSN"] for r in responses] == [f"FGT{i}" for i in range(10)]
+
+
+def test_bulk_get_limits_concurrency(sync_client):
+    lock = threading.Lock()
+    in_flight = 0
+    peak = 0
+    release = threading.Event()
+
+    def handler(request):
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+            if in_flight == 2:
+                release.set()
+        release.wait(1)
+        with lock:
+            in_flight -= 1
+        return device_handler(request)
+
+    DevicesAPI(sync_client(handler)).bulk_get([f"FGT{i}" for i in range(6)], concurrency=2)
+
+    assert peak == 2
+
+
+def test_bulk_get_passes_use_cache(sync_client):
+    seen = []
+
+    def handler(request):
+        seen.append(request.url.params.get("useCache"))
+        return device_handler(request)
+
+    DevicesAPI(sync_client(handler)).bulk_get(["FGT1"], use_cache=False)
+
+    assert seen == ["False"]
+
+
+def test_bulk_get_inside_running_event_loop(sync_client):
+    devices = DevicesAPI(sync_client(device_handler))
+
+    async def run():
+        return devices.bulk_get(["FGT1", "FGT2"])
+
+    responses = asyncio.run(run())
+
+    assert [r["data"]["deviceSN"] for r in responses] == ["FGT1", "FGT2"]
+
+
+def test_bulk_get_empty(sync_client):
+    assert DevicesAPI(sync_client(device_handler)).bulk_get([]) == []
+
+
+def test_bulk_get_rejects_non_positive_concurrency(sync_client):
+    with pytest.raises(ValueError):
+        DevicesAPI(sync_client(device_handler)).bulk_get(["FGT1"], concurrency=0)
+
+
+def list_handler(request):
+    serials = request.url.params.get("deviceSN", "ALL").split(",")
+    return httpx.Response(200, json={"data": [{"deviceSN": sn} for sn in serials]})
+
+
+@pytest.mark.parametrize("prefetch", [0, 1, 3])
+def test_iter_devices_yields_all_batches_in_order(sync_client, prefetch):
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return list_handler(request)
+
+    serials = [f"FGT{i}" for i in range(25)]
+    devices = DevicesAPI(sync_client(handler))
+
+    result = [d["deviceSN"] for d in devices.iter_devices(serials, page_size=10, prefetch=prefetch)]
+
+    assert result == serials
+    assert len(requests) == 3
+
+
+def test_iter_devices_without_serials_makes_one_request(sync_client):
+    devices = DevicesAPI(sync_client(list_handler))
+
+    assert [d["deviceSN"] for d in devices.iter_devices()] == ["ALL"]
+
+
+def test_iter_devices_opens_session_before_prefetching(sync_client):
+    client = sync_client(list_handler)
+    session = client._session
+    client._session = None
+    callers = []
+
+    def get_session():
+        callers.append(threading.current_thread())
+        client._session = session
+        return session
+
+    client._get_session = get_session
+
+    list(DevicesAPI(client).iter_devices([f"FGT{i}" for i in range(30)], page_size=10, prefetch=3))
+
+    assert callers[0] is threading.main_thread()
+
+
+def test_iter_devices_raises_on_dropped_request():
+    class DroppingClient:
+        def _get_session(self):
+            pass
+
+        def get(self, path, params=None, timeout=None):
+            return {"status": "error", "message": "Rate limit exceeded - request dropped"}
+
+    devices = DevicesAPI(DroppingClient())
+
+    with pytest.raises(RuntimeError, match="request dropped"):
+        list(devices.iter_devices(["FGT1", "FGT2"], page_size=1))
+
+
+def test_async_bulk_get_preserves_order(async_client):
+    devices = AsyncDevicesAPI(async_client(device_handler))
+
+    responses = asyncio.run(devices.bulk_get([f"FGT{i}" for i in range(5)], concurrency=2))
+
+    assert [r["data"]["deviceSN"] for r in responses] == [f"FGT{i}" for i in range(5)]
+
+
+@pytest.mark.parametrize("method, args", [
+    ("bulk_get", (["FGT1"],)),
+    ("gather_firmware_profiles", ([("FGT1", "global")],)),
+])
+def test_async_fan_out_rejects_non_positive_concurrency(async_client, method, args):
+    devices = AsyncDevicesAPI(async_client(device_handler))
+
+    with pytest.raises(ValueError):
+        asyncio.run(getattr(devices, method)(*args, concurrency=0))
+
+
+@pytest.mark.parametrize("prefetch", [1, 2])
+def test_iter_devices_limits_batches_in_flight(sync_client, prefetch):
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return list_handler(request)
+
+    serials = [f"FGT{i}" for i in range(60)]
+    iterator = DevicesAPI(sync_client(handler)).iter_devices(serials, page_size=10, prefetch=prefetch)
+
+    # While the caller is still on batch 0, only prefetch batches are fetched ahead
+    assert next(iterator) == {"deviceSN": "FGT0"}
+    for _ in range(9):
+        next(iterator)
+    time.sleep(0.1)
+    assert len(requests) == prefetch + 1
+
+    # Moving on to batch 1 queues exactly one more
+    next(iterator)
+    time.sleep(0.1)
+    assert len(requests) == prefetch + 2
+
+    assert len(list(iterator)) == 49
+    assert len(requests) == 6
+
+
+def test_get_many_uses_one_request(sync_client):
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return list_handler(request)
+
+    response = DevicesAPI(sync_client(handler)).get_many(["FGT1", "FGT2"])
+
+    assert [d["deviceSN"] for d in response["data"]["data"]] == ["FGT1", "FGT2"]
+    assert len(requests) == 1
+
+
+def test_get_many_rejects_empty_list(sync_client, async_client):
+    def handler(request):
+        raise AssertionError("request sent for an empty device list")
+
+    with pytest.raises(ValueError):
+        DevicesAPI(sync_client(handler)).get_many([])
+    with pytest.raises(ValueError):
+        asyncio.run(AsyncDevicesAPI(async_client(handler)).get_many([]))
+
+
+def test_async_get_many(async_client):
+    response = asyncio.run(AsyncDevicesAPI(async_client(list_handler)).get_many(["FGT1", "FGT2"]))
+
+    assert [d["deviceSN"] for d in response["data"]["data"]] == ["FGT1", "FGT2"]
+
+
+SPECS = [
+    {"device_sn": "FGT1", "device_type": "FortiGate", "provision_status": "provisioned",
+     "provision_target": "FortiManager", "forti_manager_oid": 12, "region": None},
+    {"deviceSN": "FAP1", "deviceType": "FortiAP", "provisionStatus": "unprovisioned"},
+]
+API_BODY = [
+    {"deviceSN": "FGT1", "deviceType": "FortiGate", "provisionStatus": "provisioned",
+     "provisionTarget": "FortiManager", "fortiManagerOid": 12},
+    {"deviceSN": "FAP1", "deviceType": "FortiAP", "provisionStatus": "unprovisioned"},
+]
+
+
+def recording_handler(sent):
+    def handler(request):
+        sent.append(request)
+        return httpx.Response(200, json={})
+
+    return handler
+
+
+def test_provision_many_sends_one_bulk_request(sync_client):
+    sent = []
+
+    DevicesAPI(sync_client(recording_handler(sent))).provision_many(SPECS)
+
+    assert len(sent) == 1
+    assert sent[0].method == "PUT"
+    assert json.loads(sent[0].content) == API_BODY
+
+
+def test_async_provision_many(async_client):
+    sent = []
+
+    asyncio.run(AsyncDevicesAPI(async_client(recording_handler(sent))).provision_many(SPECS))
+
+    assert len(sent) == 1
+    assert json.loads(sent[0].content) == API_BODY
+
+
+def test_provision_many_rejects_unknown_keys(sync_client):
+    sent = []
+
+    with pytest.raises(ValueError, match="devcie_type"):
+        DevicesAPI(sync_client(recording_handler(sent))).provision_many(
+            [{"device_sn": "FGT1", "devcie_type": "FortiGate", "provision_status": "provisioned"}]
+        )
+    assert sent == []
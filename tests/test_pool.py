@@ -0,0 +1,145 @@
+"""Tests for shared session clients and the process-wide pool (hfortix_fortiztp.pool)."""
+
+import httpx
+
+from hfortix_fortiztp import FortiZTP, pool
+from hfortix_fortiztp.pool import (
+    SharedPoolHTTPClient,
+    acquire_session_client,
+    get_shared_pool,
+    release_session_client,
+)
+
+
+class FakeClient:
+    """Stand-in for CloudHTTPClient that records logout()."""
+
+    def __init__(self):
+        self.closed = False
+
+    def logout(self):
+        self.closed = True
+
+
+def acquire(session, settings):
+    return acquire_session_client(session, "https://ztp.test", "fortiztp", settings, FakeClient)
+
+
+def test_same_settings_share_one_client(cloud_session):
+    first, first_shared = acquire(cloud_session, {"read_only": False})
+    second, second_shared = acquire(cloud_session, {"read_only": False})
+
+    assert first is second
+    assert first_shared and second_shared
+
+
+def test_different_settings_get_private_client(cloud_session):
+    shared, _ = acquire(cloud_session, {"read_only": False})
+    private, is_shared = acquire(cloud_session, {"read_only": True})
+
+    assert private is not shared
+    assert not is_shared
+
+
+def test_settings_compared_against_snapshot(cloud_session):
+    context = {"user": "alice"}
+    first, _ = acquire(cloud_session, {"user_context": context})
+
+    context["user"] = "bob"
+    second, second_shared = acquire(cloud_session, {"user_context": context})
+    third, _ = acquire(cloud_session, {"user_context": {"user": "alice"}})
+
+    assert second is not first and not second_shared
+    assert third is first
+
+
+def test_closed_when_last_reference_released(cloud_session):
+    client, _ = acquire(cloud_session, {})
+    acquire(cloud_session, {})
+
+    release_session_client(cloud_session, "https://ztp.test", "fortiztp")
+    assert not client.closed
+    release_session_client(cloud_session, "https://ztp.test", "fortiztp")
+    assert client.closed
+
+    replacement, _ = acquire(cloud_session, {})
+    assert replacement is not client
+
+
+def test_fortiztp_clients_on_one_session_share_http_client(cloud_session):
+    first = FortiZTP(session=cloud_session)
+    second = FortiZTP(session=cloud_session)
+
+    assert first._client is second._client
+
+    closed = []
+    first._client.logout = lambda: closed.append(True)
+    first.logout()
+    first.logout()  # a second logout() doesn't release another reference
+    assert closed == []
+    second.logout()
+    assert closed == [True]
+
+
+def test_cache_and_track_operations_clients_not_shared(cloud_session):
+    plain = FortiZTP(session=cloud_session)
+    cached = FortiZTP(session=cloud_session, cache=True)
+    tracked = FortiZTP(session=cloud_session, track_operations=True)
+
+    assert cached._client is not plain._client
+    assert tracked._client is not plain._client
+    assert not cached._shared_client and not tracked._shared_client
+
+    for client in (plain, cached, tracked):
+        client.logout()
+
+
+def test_shared_pool_is_process_wide(monkeypatch):
+    monkeypatch.setattr(pool, "_SHARED_POOL", None)
+
+    shared = get_shared_pool(maxsize=8)
+    try:
+        assert get_shared_pool() is shared
+        assert get_shared_pool(maxsize=99) is shared
+        assert shared._transport._pool._max_connections == 8
+    finally:
+        shared._transport.close()
+
+
+def test_closing_a_client_leaves_shared_pool_open(monkeypatch):
+    closed = []
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, json={}))
+    monkeypatch.setattr(transport, "close", lambda: closed.append(True))
+    monkeypatch.setattr(pool, "_SHARED_POOL", pool._SharedTransport(transport))
+
+    client = SharedPoolHTTPClient(url="https://ztp.test/public/api", oauth_token="token-1")
+    client.get("/v2/system")
+    client.logout()
+
+    assert closed == []
+    assert get_shared_pool() is pool._SHARED_POOL
+
+
+def test_shared_pool_clients_send_over_shared_transport(monkeypatch):
+    seen = []
+
+    def handler(request):
+        seen.append(request.headers["Authorization"])
+        return httpx.Response(200, json={})
+
+    monkeypatch.setattr(pool, "_SHARED_POOL", pool._SharedTransport(httpx.MockTransport(handler)))
+    first = FortiZTP(oauth_token="token-1", shared_pool=True)
+    second = FortiZTP(oauth_token="token-2", shared_pool=True)
+
+    first.system.get()
+    first.logout()
+    second.system.get()
+
+    assert isinstance(first._client, SharedPoolHTTPClient)
+    assert seen == ["Bearer token-1", "Bearer token-2"]
+
+
+def test_shared_pool_ignored_without_verification():
+    fz = FortiZTP(oauth_token="token-1", shared_pool=True, verify=False)
+
+    assert not isinstance(fz._client, SharedPoolHTTPClient)
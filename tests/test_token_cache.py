@@ -0,0 +1,159 @@
+"""Tests for direct-auth tokens: the process-wide cache and _LoginRefresher."""
+
+import itertools
+
+import pytest
+
+import hfortix_fortiztp._auth as auth_module
+from hfortix_fortiztp._auth import _get_token, _LoginRefresher
+
+
+class FakeAuth:
+    """Stand-in for FortiCloudAuth that hands out numbered tokens."""
+
+    _counter = itertools.count(1)
+
+    def __init__(self, api_id="api-id", password="secret", client_id="fortiztp", auth_url="https://auth.test/"):
+        self.api_id = api_id
+        self.password = password
+        self.client_id = client_id
+        self.auth_url = auth_url
+        self.logins = 0
+
+    def get_token(self, force_refresh=False):
+        self.logins += 1
+        return f"token-{next(self._counter)}"
+
+
+@pytest.fixture(autouse=True)
+def clear_token_cache():
+    auth_module._TOKEN_CACHE.clear()
+    yield
+    auth_module._TOKEN_CACHE.clear()
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable time.monotonic() for the token cache."""
+    now = [1000.0]
+    monkeypatch.setattr(auth_module.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_cache_hit_reuses_token(clock):
+    first = FakeAuth()
+    second = FakeAuth()
+
+    token, expires_at = _get_token(first)
+    clock[0] += 60
+
+    assert _get_token(second) == (token, expires_at)
+    assert second.logins == 0
+
+
+def test_cache_miss_logs_in(clock):
+    auth = FakeAuth()
+
+    token, expires_at = _get_token(auth)
+
+    assert token.startswith("token-")
+    assert expires_at == clock[0] + auth_module._TOKEN_TTL
+    assert auth.logins == 1
+
+
+def test_cached_token_not_reused_after_half_its_lifetime(clock):
+    token, _ = _get_token(FakeAuth())
+    clock[0] += auth_module._TOKEN_TTL / 2
+
+    later = FakeAuth()
+
+    assert _get_token(later)[0] != token
+    assert later.logins == 1
+
+
+def test_credentials_are_isolated():
+    token, _ = _get_token(FakeAuth(api_id="a"))
+
+    assert _get_token(FakeAuth(api_id="b"))[0] != token
+    assert _get_token(FakeAuth(api_id="a", password="other"))[0] != token
+    assert _get_token(FakeAuth(api_id="a", client_id="other"))[0] != token
+    assert _get_token(FakeAuth(api_id="a", auth_url="https://other.test/"))[0] != token
+    assert _get_token(FakeAuth(api_id="a"))[0] == token
+
+
+def test_use_cache_false_bypasses_cache():
+    token, _ = _get_token(FakeAuth())
+    auth = FakeAuth()
+
+    assert _get_token(auth, use_cache=False)[0] != token
+    assert auth.logins == 1
+    assert len(auth_module._TOKEN_CACHE) == 1
+
+
+def test_cache_is_bounded():
+    for i in range(auth_module._TOKEN_CACHE_MAXSIZE + 5):
+        _get_token(FakeAuth(api_id=f"id-{i}"))
+
+    assert len(auth_module._TOKEN_CACHE) == auth_module._TOKEN_CACHE_MAXSIZE
+
+
+def test_login_refresher_reuses_token_until_renewal(clock):
+    auth = FakeAuth()
+    refresher = _LoginRefresher(auth)
+
+    token = refresher()
+    clock[0] += auth_module._TOKEN_TTL - auth_module._TOKEN_REFRESH_BUFFER - 1
+
+    assert refresher() == token
+    assert auth.logins == 1
+
+
+def test_login_refresher_logs_in_again_before_expiry(clock):
+    auth = FakeAuth()
+    refresher = _LoginRefresher(auth)
+
+    token = refresher()
+    clock[0] += auth_module._TOKEN_TTL - auth_module._TOKEN_REFRESH_BUFFER
+
+    assert refresher.current() is None
+    assert refresher() != token
+    assert auth.logins == 2
+
+
+def test_cache_hit_does_not_shorten_client_lifetime(clock):
+    _get_token(FakeAuth())
+    clock[0] += auth_module._TOKEN_MAX_REUSE_AGE - 1
+
+    auth = FakeAuth()
+    refresher = _LoginRefresher(auth)
+    cached = refresher()
+    assert auth.logins == 0
+
+    # The cached token is renewed before it expires instead of running out
+    clock[0] += auth_module._TOKEN_TTL - auth_module._TOKEN_MAX_REUSE_AGE - auth_module._TOKEN_REFRESH_BUFFER + 1
+    assert refresher() != cached
+    assert auth.logins == 1
+
+
+def test_login_refresher_logs_in_once_across_threads():
+    import threading
+
+    auth = FakeAuth()
+    refresher = _LoginRefresher(auth, use_cache=False)
+    threads = [threading.Thread(target=refresher) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert auth.logins == 1
+
+
+def test_direct_auth_client_gets_login_refresher(monkeypatch):
+    from hfortix_fortiztp import FortiZTP
+
+    monkeypatch.setattr("hfortix_fortiztp.FortiCloudAuth", FakeAuth)
+    fz = FortiZTP(api_id="api-id", password="secret")
+
+    assert isinstance(fz._client._token_callback, _LoginRefresher)
+    assert fz._client._oauth_token == fz._client._token_callback()
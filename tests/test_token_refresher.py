@@ -0,0 +1,122 @@
+"""Tests for the CloudSession token callback (_TokenRefresher)."""
+
+import asyncio
+import itertools
+import threading
+import time
+
+import httpx
+import pytest
+from hfortix_core.session import TokenInfo
+
+from hfortix_fortiztp._auth import _TokenRefresher
+
+
+@pytest.fixture
+def session_calls(cloud_session, monkeypatch):
+    """Count ensure_token_valid() calls; a missing token is "acquired" as token-N."""
+    calls = []
+    ensure_token_valid = cloud_session.ensure_token_valid
+    numbers = itertools.count(2)
+
+    def acquire_token(client_id):
+        cloud_session._tokens[client_id] = TokenInfo(
+            access_token=f"token-{next(numbers)}",
+            refresh_token="refresh",
+            expires_in=3600,
+            created_at=time.time(),
+        )
+
+    def counting(client_id, *args, **kwargs):
+        calls.append(threading.current_thread())
+        return ensure_token_valid(client_id, *args, **kwargs)
+
+    monkeypatch.setattr(cloud_session, "_acquire_token", acquire_token)
+    monkeypatch.setattr(cloud_session, "ensure_token_valid", counting)
+    return calls
+
+
+def test_reuses_token_without_asking_session(cloud_session, session_calls):
+    refresher = _TokenRefresher(cloud_session, "fortiztp")
+
+    assert refresher() == "token-1"
+    assert refresher() == "token-1"
+    assert len(session_calls) == 1
+
+
+def test_clear_token_invalidates(cloud_session, session_calls):
+    refresher = _TokenRefresher(cloud_session, "fortiztp")
+    refresher()
+
+    cloud_session.clear_token("fortiztp")
+
+    assert refresher.current() is None
+    assert refresher() == "token-2"
+    assert len(session_calls) == 2
+
+
+def test_replaced_token_entry_invalidates(cloud_session, session_calls):
+    refresher = _TokenRefresher(cloud_session, "fortiztp")
+    refresher()
+
+    cloud_session._tokens["fortiztp"] = TokenInfo(
+        access_token="token-other",
+        refresh_token="refresh",
+        expires_in=3600,
+        created_at=time.time(),
+    )
+
+    assert refresher() == "token-other"
+
+
+def test_asks_session_inside_refresh_buffer(cloud_session, session_calls, monkeypatch):
+    refresher = _TokenRefresher(cloud_session, "fortiztp")
+    refresher()
+
+    now = time.monotonic()
+    monkeypatch.setattr("hfortix_fortiztp._auth.time.monotonic", lambda: now + 3600 - cloud_session._refresh_buffer)
+
+    assert refresher.current() is None
+    refresher()
+    assert len(session_calls) == 2
+
+
+def test_async_client_refreshes_off_the_event_loop(cloud_session, session_calls, async_client):
+    seen = []
+
+    def handler(request):
+        seen.append(request.headers["Authorization"])
+        return httpx.Response(200, json={})
+
+    client = async_client(handler, token_callback=_TokenRefresher(cloud_session, "fortiztp"))
+
+    async def run():
+        await client.get("/v2/system")
+        await client.get("/v2/system")
+
+    asyncio.run(run())
+
+    assert seen == ["Bearer token-1", "Bearer token-1"]
+    assert len(session_calls) == 1
+    assert session_calls[0] is not threading.main_thread()
+
+
+def test_async_client_refreshes_once_for_concurrent_requests(cloud_session, session_calls, async_client, monkeypatch):
+    ensure_token_valid = cloud_session.ensure_token_valid
+
+    def slow(client_id, *args, **kwargs):
+        time.sleep(0.05)
+        return ensure_token_valid(client_id, *args, **kwargs)
+
+    monkeypatch.setattr(cloud_session, "ensure_token_valid", slow)
+    client = async_client(
+        lambda request: httpx.Response(200, json={}),
+        token_callback=_TokenRefresher(cloud_session, "fortiztp"),
+    )
+
+    async def run():
+        await asyncio.gather(*[client.get("/v2/system") for _ in range(10)])
+
+    asyncio.run(run())
+
+    assert len(session_calls) == 1